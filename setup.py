@@ -48,8 +48,6 @@ setup(
         "Intended Audience :: Developers",
         "License :: Other/Proprietary License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
@@ -57,7 +55,7 @@ setup(
         "Topic :: Database :: Front-Ends",
         "Framework :: AsyncIO",
     ],
-    python_requires='>=3.8',
+    python_requires='>=3.10',
     license='ZTeraDB',
     extras_require = {
         "dev": [
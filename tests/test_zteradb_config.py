@@ -0,0 +1,252 @@
+# -----------------------------------------------------------------------------
+# File: test_zteradb_config.py
+# Description: This file contains the test cases for the ZTeraDB configuration
+#              classes. The tests verify that ZTeraDBConfig, Options and
+#              ConnectionPool accept valid settings, reject invalid ones with a
+#              descriptive ValueError, and that the cached validation result is
+#              dropped when the configuration changes.
+#
+# License: ZTeraDB
+# Copyright (c) 2025 ZTeraDB
+#
+# The code in this file is proprietary and confidential. It may not be shared,
+# re-engineered, reverse-engineered, modified, or distributed in any way without
+# express written permission from the copyright holder.
+#
+# All rights are reserved to the copyright holder.
+#
+# License URL: https://zteradb.com/licence
+# -----------------------------------------------------------------------------
+
+import sys
+import os
+import dataclasses
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from zteradb.config import zteradb_config
+from zteradb.config.zteradb_config import ZTeraDBConfig
+from zteradb.config.envs import ENVS
+from zteradb.config.response_data_types import ResponseDataTypes
+from zteradb.config.options import Options
+from zteradb.config.connection_pool import ConnectionPool
+from zteradb.connection.zteradb_connection import ZTeraDBConnectionAsync
+
+
+def make_config(**kwargs):
+    """
+    Returns a valid ZTeraDBConfig, with the given settings overridden.
+    """
+    settings = dict(client_key="client_key", access_key="access_key", secret_key="secret_key",
+                    database_id="database_id", env="dev", response_data_type="json")
+    settings.update(kwargs)
+    return ZTeraDBConfig(**settings)
+
+
+# Test Class for ZTeraDBConfig
+# This test suite verifies the validation of the ZTeraDB configuration.
+
+class TestZTeraDBConfig(unittest.TestCase):
+    def test_validation_state_is_not_a_field(self):
+        """
+        Test that the cached validation result is not part of the dataclass fields.
+
+        Steps:
+        1. Create a valid configuration.
+        2. Assert that `_validated` is not listed by `fields()` or `asdict()`, and not shown by `repr()`.
+        """
+        # Step 1: Create a valid configuration
+        config = make_config()
+
+        # Step 2: Assert the public field list
+        self.assertNotIn("_validated", [field.name for field in dataclasses.fields(config)])
+        self.assertNotIn("_validated", dataclasses.asdict(config))
+        self.assertNotIn("_validated", repr(config))
+
+    def test_revalidate_after_field_change(self):
+        """
+        Test that reassigning a field drops the cached validation result.
+
+        Steps:
+        1. Create a valid configuration and assign an invalid environment.
+        2. Assert that `is_valid()` raises a `ValueError`.
+        """
+        # Step 1: Assign an invalid environment
+        config = make_config()
+        config.env = "unknown"
+
+        # Step 2: Assert that the configuration is checked again
+        with self.assertRaises(ValueError) as context:
+            config.is_valid()
+        self.assertEqual(str(context.exception),
+                         "'unknown' is not a valid environment key. Valid options are: dev, staging, qa, prod")
+
+    def test_options_are_validated_on_every_call(self):
+        """
+        Test that options changed in place are validated again by `is_valid()`.
+
+        Steps:
+        1. Create a valid configuration with a connection pool.
+        2. Raise the minimum connections above the maximum in place.
+        3. Assert that `is_valid()` raises a `ValueError`.
+        """
+        # Step 1: Create a configuration with a connection pool
+        config = make_config(options=Options(connection_pool={"min": 1, "max": 2}))
+
+        # Step 2: Change the connection pool in place
+        config.options.connection_pool.min = 10
+
+        # Step 3: Assert that the change is caught
+        with self.assertRaises(ValueError):
+            config.is_valid()
+
+    def test_reject_non_integer_connect_timeout(self):
+        """
+        Test that `connect_timeout` must be an int, booleans included.
+
+        Steps:
+        1. Create configurations with a boolean and a float timeout.
+        2. Assert that a `ValueError` is raised for each.
+        3. Assert that an integer timeout is accepted.
+        """
+        # Step 1 and 2: Invalid timeouts
+        for timeout in (True, 1.5):
+            with self.subTest(connect_timeout=timeout):
+                with self.assertRaises(ValueError) as context:
+                    make_config(connect_timeout=timeout)
+                self.assertEqual(str(context.exception), "connect_timeout must be an integer.")
+
+        # Step 3: Valid timeout
+        self.assertEqual(make_config(connect_timeout=5).connect_timeout, 5)
+
+    def test_reject_non_string_database_id(self):
+        """
+        Test that a falsy non-string `database_id` such as 0 is rejected.
+
+        Steps:
+        1. Create configurations with `database_id` set to 0 and to an empty list.
+        2. Assert that a `ValueError` is raised for each.
+        3. Assert that `database_id=None` is still accepted.
+        """
+        # Step 1 and 2: Invalid database ids
+        for database_id in (0, []):
+            with self.subTest(database_id=database_id):
+                with self.assertRaises(ValueError) as context:
+                    make_config(database_id=database_id)
+                self.assertEqual(str(context.exception), "database_id must be a string.")
+
+        # Step 3: No database id
+        self.assertIsNone(make_config(database_id=None).database_id)
+
+    def test_reject_blank_required_keys(self):
+        """
+        Test that the client, access and secret keys must be non-empty strings.
+        """
+        for name in ("client_key", "access_key", "secret_key"):
+            with self.subTest(field=name):
+                with self.assertRaises(ValueError) as context:
+                    make_config(**{name: " "})
+                self.assertEqual(str(context.exception), f"'{name}' must be a non-empty string.")
+
+    def test_env_and_response_data_type_values_are_interned(self):
+        """
+        Test that the environment and response data type are stored as the interned value strings.
+
+        Steps:
+        1. Create a configuration from strings built at runtime.
+        2. Assert that the stored values are the interned strings.
+        3. Create a configuration from enum members and assert that their values are stored.
+        """
+        # Step 1: Strings built at runtime are equal but not identical to the constants
+        env = "".join(["pr", "od"])
+        response_data_type = "".join(["js", "on"])
+        config = make_config(env=env, response_data_type=response_data_type)
+
+        # Step 2: Assert the interned values
+        self.assertIs(config.env, sys.intern("prod"))
+        self.assertIs(config.response_data_type, sys.intern("json"))
+
+        # Step 3: Enum members
+        config = make_config(env=ENVS.QA, response_data_type=ResponseDataTypes.JSON)
+        self.assertEqual((config.env, config.response_data_type), ("qa", "json"))
+
+    def test_reject_invalid_response_data_type(self):
+        """
+        Test that an unknown or non-string response data type is rejected.
+        """
+        for response_data_type in ("xml", ["json"]):
+            with self.subTest(response_data_type=response_data_type):
+                with self.assertRaises(ValueError) as context:
+                    make_config(response_data_type=response_data_type)
+                self.assertEqual(str(context.exception),
+                                 f"'{response_data_type}' is an invalid response data type. Valid choices are: json")
+
+    def test_default_config_fallback(self):
+        """
+        Test that a connection without a configuration falls back to `ZTERADB_CONF`.
+
+        Steps:
+        1. Set a configuration with a connection pool as the default for the current context.
+        2. Create a connection without a configuration and assert that it uses the default.
+        3. Reset the default and assert that a connection without a configuration is rejected.
+        """
+        # Step 1: Set the default configuration
+        config = make_config(options=Options(connection_pool={"min": 1, "max": 2}))
+        token = zteradb_config.ZTERADB_CONF.set(config)
+
+        try:
+            # Step 2: The connection picks up the default configuration
+            connection = ZTeraDBConnectionAsync("127.0.0.1", 7777)
+            self.assertIs(connection.connection_manager.zteradb_conf, config)
+
+        finally:
+            zteradb_config.ZTERADB_CONF.reset(token)
+
+        # Step 3: No default configuration
+        self.assertIsNone(zteradb_config.ZTERADB_CONF.get())
+        with self.assertRaisesRegex(Exception, "is not valid ZTeraDBConfig"):
+            ZTeraDBConnectionAsync("127.0.0.1", 7777)
+
+
+# Test Class for ConnectionPool and Options
+# This test suite verifies the connection pool settings.
+
+class TestConnectionPool(unittest.TestCase):
+    def test_from_dict(self):
+        """
+        Test that `ConnectionPool.from_dict()` reads "min" and "max", with 0 for missing keys.
+        """
+        self.assertEqual(ConnectionPool.from_dict({"min": 1, "max": 5}), ConnectionPool(min=1, max=5))
+        self.assertEqual(ConnectionPool.from_dict({"max": 5}), ConnectionPool(min=0, max=5))
+        self.assertEqual(ConnectionPool.from_dict({}), ConnectionPool())
+
+    def test_options_accept_dict(self):
+        """
+        Test that `Options` turns a connection pool dictionary into a `ConnectionPool`.
+        """
+        options = Options(connection_pool={"min": 1, "max": 5})
+        self.assertEqual(options.connection_pool, ConnectionPool(min=1, max=5))
+        self.assertEqual(Options().connection_pool, ConnectionPool())
+
+    def test_reject_non_integer_sizes(self):
+        """
+        Test that the pool sizes must be int, booleans included.
+        """
+        for pool in (ConnectionPool(min=True, max=2), ConnectionPool(min=0, max=2.0)):
+            with self.subTest(pool=pool):
+                with self.assertRaises(ValueError):
+                    pool.is_valid()
+
+    def test_reject_min_above_max(self):
+        """
+        Test that the minimum connections can not exceed the maximum connections.
+        """
+        with self.assertRaises(ValueError) as context:
+            Options(connection_pool={"min": 3, "max": 2}).is_valid()
+        self.assertEqual(str(context.exception),
+                         "min connection must be less than or equal to max connections in the connection_pool")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,301 @@
+# -----------------------------------------------------------------------------
+# File: test_zteradb_connection.py
+# Description: This file contains the test cases for ZTeraDBConnectionAsync.
+#              The tests run queries against a stub connection manager whose
+#              connections yield canned rows, and verify that `run_many()`
+#              returns the results in order, limits the number of concurrent
+#              queries, and cancels the remaining queries when one of them fails.
+#              A query cancelled against a local asyncio server checks that its
+#              connection is closed rather than returned to the pool unread.
+#
+# License: ZTeraDB
+# Copyright (c) 2025 ZTeraDB
+#
+# The code in this file is proprietary and confidential. It may not be shared,
+# re-engineered, reverse-engineered, modified, or distributed in any way without
+# express written permission from the copyright holder.
+#
+# All rights are reserved to the copyright holder.
+#
+# License URL: https://zteradb.com/licence
+# -----------------------------------------------------------------------------
+
+import sys
+import os
+import json
+import asyncio
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from zteradb import ZTeraDBQuery, ZTeraDBQueryError
+from zteradb.config.zteradb_config import ZTeraDBConfig
+from zteradb.connection.zteradb_connection import ZTeraDBConnectionAsync, ZTeraDBConnectionManager
+from zteradb.lib.zteradb_data_manager import DataManager
+from zteradb.lib.zteradb_request_types_fast import RESPONSE_QUERY_COMPLETE
+from zteradb.protocol.zteradb_connection_protocol import ZTeraDBClientProtocol
+
+
+class StubConnection:
+    """
+    A pooled connection answering every query from the `responses` of its manager.
+
+    A response is a list of rows, an exception to raise, or a number of seconds to wait
+    before answering with a single row.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    async def execute_query(self, query, connection_manager, query_timeout=None):
+        self.manager.active += 1
+        self.manager.peak = max(self.manager.peak, self.manager.active)
+        interrupted = False
+
+        try:
+            response = self.manager.responses[query.schema_name]
+            if isinstance(response, Exception):
+                raise response
+
+            if isinstance(response, (int, float)):
+                await asyncio.sleep(response)
+                response = [{"waited": response}]
+
+            for row in response:
+                await asyncio.sleep(0)
+                yield row
+
+        except asyncio.CancelledError:
+            self.manager.cancelled.append(query.schema_name)
+            interrupted = True
+            raise
+
+        finally:
+            self.manager.active -= 1
+            if interrupted:
+                await connection_manager.discard_connection(self)
+            else:
+                await connection_manager.release_connection(self)
+
+
+class StubConnectionManager:
+    """
+    A connection manager handing out StubConnection objects and counting the released and discarded ones.
+    """
+
+    def __init__(self, responses, max_connections=None):
+        self.responses = responses
+        self.max_connections = max_connections
+        self.released = 0
+        self.discarded = 0
+        self.active = 0
+        self.peak = 0
+        self.cancelled = []
+
+    async def get_connection(self):
+        return StubConnection(self)
+
+    async def release_connection(self, connection):
+        self.released += 1
+
+    async def discard_connection(self, connection):
+        self.discarded += 1
+
+
+def make_connection(manager):
+    """
+    Returns a ZTeraDBConnectionAsync using the given stub connection manager.
+    """
+    connection = ZTeraDBConnectionAsync.__new__(ZTeraDBConnectionAsync)
+    connection.connection_manager = manager
+    return connection
+
+
+# Test Class for ZTeraDBConnectionAsync.run_many
+# This test suite verifies running several queries concurrently.
+
+class TestRunMany(unittest.IsolatedAsyncioTestCase):
+    async def test_results_in_query_order(self):
+        """
+        Test that `run_many()` returns one result per query, in the order of the queries.
+
+        Steps:
+        1. Run a slow SELECT query, a fast SELECT query and an INSERT query together.
+        2. Assert that SELECT queries give all their rows and the INSERT query its single result.
+        3. Assert that every connection was released.
+        """
+        manager = StubConnectionManager({
+            "slow": 0.05,
+            "fast": [{"id": 1}, {"id": 2}],
+            "new": [{"inserted": 1}],
+        })
+
+        # Step 1: Run the queries
+        results = await make_connection(manager).run_many([
+            ZTeraDBQuery("slow").select(),
+            ZTeraDBQuery("fast").select(),
+            ZTeraDBQuery("new").insert().fields(name="John"),
+        ])
+
+        # Step 2: Assert the results
+        self.assertEqual(results, [[{"waited": 0.05}], [{"id": 1}, {"id": 2}], {"inserted": 1}])
+
+        # Step 3: Assert that the connections were released
+        self.assertEqual(manager.released, 3)
+
+    async def test_limit_concurrent_queries_to_max_connections(self):
+        """
+        Test that no more than `max_connections` queries run at once.
+        """
+        manager = StubConnectionManager({f"schema_{index}": 0.01 for index in range(6)}, max_connections=2)
+
+        await make_connection(manager).run_many([ZTeraDBQuery(f"schema_{index}").select() for index in range(6)])
+
+        self.assertEqual(manager.peak, 2)
+        self.assertEqual(manager.released, 6)
+
+    async def test_cancel_remaining_queries_on_failure(self):
+        """
+        Test that a failing query cancels the queries still running, which discard their connections.
+
+        Steps:
+        1. Run two slow queries together with a query that fails.
+        2. Assert that the error of the failing query is raised without waiting for the slow ones.
+        3. Assert that the slow queries were cancelled and discarded their connections.
+        """
+        manager = StubConnectionManager({
+            "slow_1": 30,
+            "failing": ZTeraDBQueryError("Query failed"),
+            "slow_2": 30,
+        })
+
+        # Step 1 and 2: The failure is raised right away
+        with self.assertRaises(ZTeraDBQueryError):
+            await asyncio.wait_for(make_connection(manager).run_many([
+                ZTeraDBQuery("slow_1").select(),
+                ZTeraDBQuery("failing").select(),
+                ZTeraDBQuery("slow_2").select(),
+            ]), timeout=5)
+
+        # Step 3: Only the failing query hands its connection back to the pool
+        self.assertEqual(sorted(manager.cancelled), ["slow_1", "slow_2"])
+        self.assertEqual(manager.released, 1)
+        self.assertEqual(manager.discarded, 2)
+        self.assertEqual(manager.active, 0)
+
+    async def test_reject_invalid_query(self):
+        """
+        Test that `run_many()` rejects anything but ZTeraDBQuery objects before running any query.
+        """
+        manager = StubConnectionManager({"schema": [{"id": 1}]})
+
+        with self.assertRaises(ValueError):
+            await make_connection(manager).run_many([ZTeraDBQuery("schema").select(), "query"])
+
+        self.assertEqual(manager.released, 0)
+
+def response_frame(response_code, data=None) -> bytes:
+    """
+    Returns a query response from the server as a length-prefixed frame.
+    """
+    return DataManager(json.dumps({"error": False, "response_code": response_code, "data": data}).encode()).pack()
+
+
+# Test Class for cancelling a query on a real connection
+# Each test starts a local server which streams the rows of every query it receives,
+# and connects a ZTeraDBClientProtocol from a ZTeraDBConnectionManager pool to it.
+
+class TestCancelQuery(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """
+        Set up the test environment.
+        Starts a local server on a free port, and a connection manager with one pooled connection to it.
+        """
+        self.server = await asyncio.start_server(self._handle_client, '127.0.0.1', 0)
+        port = self.server.sockets[0].getsockname()[1]
+
+        config = ZTeraDBConfig(client_key="client_key", access_key="access_key", secret_key="secret_key",
+                               database_id="database_id", env="dev", response_data_type="json")
+        self.manager = ZTeraDBConnectionManager(host='127.0.0.1', port=port, zteradb_conf=config)
+
+        self.connection = ZTeraDBClientProtocol(host='127.0.0.1', port=port, zteradb_conf=config)
+        await self.connection.open_connection()
+
+    async def asyncTearDown(self):
+        """
+        Close the connections and the local server.
+        """
+        await self.connection.close()
+        await self.manager.close()
+
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle_client(self, reader, writer):
+        """
+        Streams 100 rows for every query received, then reports the query as complete.
+        """
+        try:
+            while True:
+                # Read the query request
+                header = await reader.readexactly(DataManager.BUFFER_SIZE)
+                await reader.readexactly(int.from_bytes(header, "big"))
+
+                for index in range(100):
+                    writer.write(response_frame(0, {"id": index}))
+                    await writer.drain()
+                    await asyncio.sleep(0.001)
+
+                writer.write(response_frame(RESPONSE_QUERY_COMPLETE))
+                await writer.drain()
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+        finally:
+            writer.close()
+
+    async def test_cancelled_query_does_not_return_connection_to_pool(self):
+        """
+        Test that a query cancelled while rows are still arriving closes its connection.
+
+        Steps:
+        1. Run a query from the pooled connection and cancel it once the first row is read.
+        2. Assert that the connection is closed and was not put back in the pool.
+        3. Assert that a completed query puts its connection back in the pool.
+        """
+        rows = []
+
+        async def run_query(connection):
+            async for row in connection.execute_query(ZTeraDBQuery("user").select(), self.manager):
+                rows.append(row)
+
+        # Step 1: Cancel the query while the server is still streaming
+        await self.manager.release_connection(self.connection)
+        task = asyncio.ensure_future(run_query(await self.manager.get_connection()))
+        while not rows:
+            await asyncio.sleep(0.001)
+
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        # Step 2: The connection with the rest of the rows pending is not reused
+        self.assertLess(len(rows), 100)
+        self.assertFalse(self.connection.is_connected)
+        self.assertTrue(self.manager.connections.empty())
+
+        # Step 3: A completed query releases its connection
+        self.connection = ZTeraDBClientProtocol(host='127.0.0.1', port=self.manager.port,
+                                                zteradb_conf=self.manager.zteradb_conf)
+        await self.connection.open_connection()
+        rows.clear()
+        await asyncio.wait_for(run_query(self.connection), timeout=5)
+
+        self.assertEqual(rows, [{"id": index} for index in range(100)])
+        self.assertIs(await self.manager.get_connection(), self.connection)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
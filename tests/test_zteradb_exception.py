@@ -0,0 +1,123 @@
+# -----------------------------------------------------------------------------
+# File: test_zteradb_exception.py
+# Description: This file contains the test cases for the ZTeraDB exception
+#              classes. The tests verify that every exception keeps the message
+#              it was raised with, exposes it through `message` and `to_dict()`,
+#              survives pickling, and only accepts the message positionally.
+#
+# License: ZTeraDB
+# Copyright (c) 2025 ZTeraDB
+#
+# The code in this file is proprietary and confidential. It may not be shared,
+# re-engineered, reverse-engineered, modified, or distributed in any way without
+# express written permission from the copyright holder.
+#
+# All rights are reserved to the copyright holder.
+#
+# License URL: https://zteradb.com/licence
+# -----------------------------------------------------------------------------
+
+import sys
+import os
+import pickle
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from zteradb import ZTeraDBQuery
+from zteradb.exceptions.zteradb_exception import (
+    ZTeraBaseError, ZTeraDBError, ZTeraDBQueryError, ZTeraDBConditionError,
+    NoResponseDataError, QueryComplete, AuthenticationFailed,
+)
+
+EXCEPTION_CLASSES = (ZTeraBaseError, ZTeraDBError, ZTeraDBQueryError, ZTeraDBConditionError,
+                     NoResponseDataError, QueryComplete, AuthenticationFailed)
+
+
+# Test Class for the ZTeraDB exceptions
+# This test suite verifies the behaviour shared by all the ZTeraDB exception classes.
+
+class TestZTeraDBException(unittest.TestCase):
+    def test_exceptions_keep_message(self):
+        """
+        Test that every exception class keeps the message it was raised with.
+
+        Steps:
+        1. Create an instance of every exception class with a message.
+        2. Assert that the message is available as `message`, `str()` and `to_dict()`.
+        """
+        for exception_class in EXCEPTION_CLASSES:
+            with self.subTest(exception_class=exception_class.__name__):
+                # Step 1: Create the exception
+                error = exception_class("Something failed")
+
+                # Step 2: Assert the message
+                self.assertEqual(error.message, "Something failed")
+                self.assertEqual(str(error), "Something failed")
+                self.assertEqual(error.to_dict(), {'message': "Something failed"})
+
+    def test_query_error_raised_by_query(self):
+        """
+        Test that the `ZTeraDBQueryError` raised by a query carries its message.
+
+        Steps:
+        1. Generate a query without a query type.
+        2. Assert that the raised error stores the message used as the exception text.
+        """
+        # Step 1: Generating without a query type raises ZTeraDBQueryError
+        with self.assertRaises(ZTeraDBQueryError) as context:
+            ZTeraDBQuery('my_schema_hash').generate()
+
+        # Step 2: Assert the stored message
+        self.assertEqual(context.exception.message, str(context.exception), "should store the error message")
+
+    def test_message_defaults_to_empty_string(self):
+        """
+        Test that an exception created without arguments has an empty message.
+        """
+        self.assertEqual(ZTeraDBError().message, '')
+
+    def test_message_is_positional_only(self):
+        """
+        Test that the message can not be passed as a keyword argument.
+
+        The exceptions have no `__init__` of their own and use the built-in exception
+        initializer, which does not accept keyword arguments.
+
+        Steps:
+        1. Create an exception with `message=` and assert that a `TypeError` is raised.
+        """
+        # Step 1: Keyword message
+        for exception_class in EXCEPTION_CLASSES:
+            with self.subTest(exception_class=exception_class.__name__):
+                with self.assertRaises(TypeError):
+                    exception_class(message="Something failed")
+
+    def test_message_is_read_only(self):
+        """
+        Test that the message can not be reassigned after the exception was created.
+        """
+        error = ZTeraDBQueryError("Query failed")
+        with self.assertRaises(AttributeError):
+            error.message = "Other"
+
+    def test_pickle_exceptions(self):
+        """
+        Test that every exception class survives a pickle round trip.
+
+        Steps:
+        1. Pickle and unpickle an instance of every exception class.
+        2. Assert that the type and the message are preserved.
+        """
+        for exception_class in EXCEPTION_CLASSES:
+            with self.subTest(exception_class=exception_class.__name__):
+                # Step 1: Round trip the exception through pickle
+                error = pickle.loads(pickle.dumps(exception_class("Query failed")))
+
+                # Step 2: Assert the type and the message
+                self.assertIs(type(error), exception_class)
+                self.assertEqual(error.message, "Query failed", "should restore the error message")
+
+
+if __name__ == '__main__':
+    unittest.main()
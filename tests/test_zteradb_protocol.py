@@ -0,0 +1,268 @@
+# -----------------------------------------------------------------------------
+# File: test_zteradb_protocol.py
+# Description: This file contains the test cases for the ZTeraDBTCPProtocol class.
+#              The tests run a local asyncio server and verify that
+#              length-prefixed frames are reassembled correctly from the receive
+#              buffer, that readers are woken up when the peer closes the
+#              connection, that incoming data can be discarded, and that reading
+#              is paused while too many frames wait in the queue.
+#
+# License: ZTeraDB
+# Copyright (c) 2025 ZTeraDB
+#
+# The code in this file is proprietary and confidential. It may not be shared,
+# re-engineered, reverse-engineered, modified, or distributed in any way without
+# express written permission from the copyright holder.
+#
+# All rights are reserved to the copyright holder.
+#
+# License URL: https://zteradb.com/licence
+# -----------------------------------------------------------------------------
+
+import sys
+import os
+import asyncio
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from zteradb.lib.zteradb_data_manager import DataManager
+from zteradb.protocol import zteradb_protocol
+from zteradb.protocol.zteradb_protocol import ZTeraDBTCPProtocol
+
+
+def frame(payload: bytes) -> bytes:
+    """
+    Returns the payload as a length-prefixed frame.
+    """
+    return DataManager(payload).pack()
+
+
+async def wait_until(predicate, timeout=2):
+    """
+    Waits until `predicate()` is true, failing with a TimeoutError after `timeout` seconds.
+    """
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout=timeout)
+
+
+# Test Class for ZTeraDBTCPProtocol
+# Each test starts a local server which runs `self.server_script` for the client
+# connection, then connects a ZTeraDBTCPProtocol to it.
+
+class TestZTeraDBTCPProtocol(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """
+        Set up the test environment.
+        Starts a local server on a free port; the test sets `server_script` before connecting.
+        """
+        self.server_script = None
+        self.server = await asyncio.start_server(self._handle_client, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        """
+        Close the client connection and the local server.
+        """
+        if getattr(self, 'transport', None) is not None:
+            self.transport.close()
+
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle_client(self, reader, writer):
+        """
+        Runs the server script for the connected client, then closes the connection.
+        """
+        try:
+            await self.server_script(reader, writer)
+        finally:
+            writer.close()
+
+    async def connect(self):
+        """
+        Connects a ZTeraDBTCPProtocol to the local server and returns it.
+        """
+        self.transport, protocol = await asyncio.get_running_loop().create_connection(
+            ZTeraDBTCPProtocol, '127.0.0.1', self.port
+        )
+        return protocol
+
+    async def test_read_split_and_coalesced_frames(self):
+        """
+        Test that frames split across several receives, and several frames received at once, are read intact.
+
+        Steps:
+        1. Send a frame in three pieces, the first one cutting through the header.
+        2. Send two frames in a single write.
+        3. Assert that the three frames are read in order.
+        """
+        async def server_script(reader, writer):
+            # Step 1: Send a frame in pieces
+            data = frame(b'{"split": true}')
+            for part in (data[:2], data[2:9], data[9:]):
+                writer.write(part)
+                await writer.drain()
+                await asyncio.sleep(0.01)
+
+            # Step 2: Send two frames at once
+            writer.write(frame(b'first') + frame(b'second'))
+            await writer.drain()
+            await reader.read()
+
+        self.server_script = server_script
+        protocol = await self.connect()
+
+        # Step 3: Assert the frames
+        self.assertEqual((await protocol.read()).from_json(), {"split": True})
+        self.assertEqual((await protocol.read()).data, b'first')
+        self.assertEqual((await protocol.read()).data, b'second')
+
+    async def test_read_empty_frame(self):
+        """
+        Test that a frame with a 0-byte payload is read as an empty DataManager.
+
+        Steps:
+        1. Send an empty frame followed by a regular frame.
+        2. Assert that both are read in order.
+        """
+        async def server_script(reader, writer):
+            # Step 1: Send an empty and a regular frame
+            writer.write(frame(b'') + frame(b'after'))
+            await writer.drain()
+            await reader.read()
+
+        self.server_script = server_script
+        protocol = await self.connect()
+
+        # Step 2: Assert the frames
+        self.assertEqual((await protocol.read()).data, b'')
+        self.assertEqual((await protocol.read()).data, b'after')
+
+    async def test_read_frame_larger_than_receive_buffer(self):
+        """
+        Test that a frame larger than the initial 256 KiB receive buffer is read intact.
+
+        Steps:
+        1. Send a 1 MiB frame followed by a small frame.
+        2. Assert that both frames are read intact.
+        3. Assert that the receive buffer shrinks back to its initial size.
+        """
+        payload = bytes(range(256)) * 4096
+
+        async def server_script(reader, writer):
+            # Step 1: Send a large and a small frame
+            writer.write(frame(payload) + frame(b'tail'))
+            await writer.drain()
+            await reader.read()
+
+        self.server_script = server_script
+        protocol = await self.connect()
+
+        # Step 2: Assert the frames
+        self.assertGreater(len(payload), zteradb_protocol._RECEIVE_BUFFER_SIZE)
+        self.assertEqual((await protocol.read()).data, payload)
+        self.assertEqual((await protocol.read()).data, b'tail')
+
+        # Step 3: The memory grown for the large frame is released
+        self.assertEqual(len(protocol._rxbuf), zteradb_protocol._RECEIVE_BUFFER_SIZE)
+
+    async def test_read_after_peer_closes(self):
+        """
+        Test that `read()` returns the frames received before the peer closed, then None.
+
+        Steps:
+        1. Send one frame and close the connection from the server side.
+        2. Assert that the frame is read, then `read()` returns None.
+        3. Assert that further reads return None instead of waiting forever.
+        """
+        async def server_script(reader, writer):
+            # Step 1: Send a frame and close
+            writer.write(frame(b'last'))
+            await writer.drain()
+
+        self.server_script = server_script
+        protocol = await self.connect()
+
+        # Step 2: Assert the frame, then the end of the connection
+        self.assertEqual((await protocol.read()).data, b'last')
+        self.assertIsNone(await asyncio.wait_for(protocol.read(), timeout=1))
+        self.assertFalse(protocol.is_connected)
+
+        # Step 3: Further reads do not block
+        self.assertIsNone(await asyncio.wait_for(protocol.read(), timeout=1))
+
+    async def test_discard_all_incoming_data(self):
+        """
+        Test that `discard_all_incoming_data()` drops queued and incoming frames until the peer closes.
+
+        Steps:
+        1. Receive a frame that stays queued.
+        2. Start discarding, and let the server send more frames before closing.
+        3. Assert that discarding returns once the connection is closed and nothing was queued.
+        """
+        release = asyncio.Event()
+
+        async def server_script(reader, writer):
+            # Step 1: Send a frame that stays queued
+            writer.write(frame(b'queued'))
+            await writer.drain()
+
+            # Step 2: Send more frames once the client discards
+            await release.wait()
+            for _ in range(10):
+                writer.write(frame(b'dropped'))
+            await writer.drain()
+
+        self.server_script = server_script
+        protocol = await self.connect()
+        await wait_until(lambda: not protocol._frames.empty())
+
+        release.set()
+        await asyncio.wait_for(protocol.discard_all_incoming_data(), timeout=1)
+
+        # Step 3: Assert nothing but the end-of-connection marker was queued
+        self.assertFalse(protocol.is_connected)
+        self.assertIsNone(await asyncio.wait_for(protocol.read(), timeout=1))
+        self.assertTrue(protocol._frames.empty())
+
+    async def test_pause_reading_while_frames_are_pending(self):
+        """
+        Test that reading is paused while the reader falls behind, and resumed once it catches up.
+
+        Steps:
+        1. Send many more frames than the pending frame limit without reading them.
+        2. Assert that reading is paused and the queue stays bounded.
+        3. Read all the frames and assert that they arrive complete and in order.
+        """
+        count = zteradb_protocol._MAX_PENDING_FRAMES * 20
+
+        async def server_script(reader, writer):
+            # Step 1: Send many frames
+            for index in range(count):
+                writer.write(frame(str(index).encode() * 512))
+            await writer.drain()
+            await reader.read()
+
+        self.server_script = server_script
+        protocol = await self.connect()
+        await wait_until(lambda: protocol._reading_paused)
+
+        # Step 2: Assert the queue is bounded while paused
+        await asyncio.sleep(0.05)
+        self.assertTrue(protocol._reading_paused)
+        self.assertLess(protocol._frames.qsize(), count)
+
+        # Step 3: Read every frame
+        for index in range(count):
+            data = await asyncio.wait_for(protocol.read(), timeout=1)
+            self.assertEqual(data.data, str(index).encode() * 512)
+
+        self.assertFalse(protocol._reading_paused)
+
+
+if __name__ == '__main__':
+    unittest.main()
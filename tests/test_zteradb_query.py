@@ -25,12 +25,16 @@
 
 import sys
 import os
+import json
 import unittest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from zteradb import ZTeraDBQuery, Sort, ZTeraDBQueryError
+from zteradb.query.zteradb_query import Limit, Query
 from zteradb.query.zteradb_query_type import ZTeraDBQueryType
+from zteradb.query.filter_condition import ZTGTE, ZTLT
+from zteradb.query.zteradb_filter_conditions import ZTeraDBFilterCondition
 
 # Test Class for ZTeraDBQuery
 # This test suite is designed to test the functionalities of the ZTeraDBQuery class,
@@ -837,6 +841,386 @@ class TestZTeraDBQuery(unittest.TestCase):
         # Step 3: Assert that the final limit is (10, 20), as the second limit call overrides the first
         self.assertEqual(self.query.get_limit(), (10, 20))
 
+    def test_set_single_field(self):
+        """
+        Test that the `field()` method and dynamic attributes set fields correctly.
+
+        This test ensures that fields set through the explicit `field()` method and
+        through dynamic attribute assignment both end up in the query fields.
+
+        Steps:
+        1. Set a field using the `field()` method.
+        2. Set another field using dynamic attribute assignment.
+        3. Assert that both fields are returned by `fields()` and readable as attributes.
+        """
+        # Step 1: Set a field using the field() method
+        self.query.insert().field("field1", "hello")
+
+        # Step 2: Set a field using dynamic attribute assignment
+        self.query.field2 = "world"
+
+        # Step 3: Assert that both fields are set
+        self.assertEqual(self.query.fields(), dict(field1="hello", field2="world"), "should set single fields")
+        self.assertEqual(self.query.field2, "world", "should read dynamic field")
+
+    def test_throw_error_for_blank_field_name(self):
+        """
+        Test that blank field names and container filter values are rejected.
+
+        This test ensures that `fields()` raises a `ValueError` for a blank field name,
+        that `filter()` accepts `None` values and rejects empty containers.
+
+        Steps:
+        1. Try setting a field with a blank name and assert that a `ValueError` is raised.
+        2. Set a filter with a `None` value and assert that it is stored.
+        3. Try setting a filter with an empty list and assert that a `ValueError` is raised.
+        """
+        # Step 1: A blank field name is not a schema field
+        with self.assertRaises(ValueError) as context:
+            self.query.insert().fields(**{' ': 1})
+        self.assertEqual(str(context.exception), "' ' must be a schema field")
+
+        # Step 2: None is a valid filter value
+        self.query.filter(field1=None)
+        self.assertEqual(self.query.filters(), dict(field1=None))
+
+        # Step 3: Empty containers are objects too
+        with self.assertRaises(ValueError) as context:
+            self.query.filter(field2=[])
+        self.assertEqual(str(context.exception), "'[]' must not be any object.")
+
+    def test_generate_is_cached_until_query_changes(self):
+        """
+        Test that `generate()` reuses its output until the query is modified.
+
+        This test ensures that repeated `generate()` calls return the cached dictionary, and that
+        a builder method called afterwards invalidates the cache so the change shows up.
+
+        Steps:
+        1. Build a SELECT query and generate it twice.
+        2. Assert that both calls return the same dictionary object.
+        3. Add a filter and generate the query again.
+        4. Assert that the new output contains the filter.
+        """
+        # Step 1: Build a SELECT query and generate it twice
+        self.query.select().fields(field1=1)
+        first = self.query.generate()
+        second = self.query.generate()
+
+        # Step 2: Assert that the cached dictionary is returned
+        self.assertIs(first, second, "should return the cached query")
+
+        # Step 3: Change the query and generate it again
+        self.query.filter(field1="value")
+        result = self.query.generate()
+
+        # Step 4: Assert that the change is part of the new output
+        self.assertIsNot(result, first, "should invalidate the cached query")
+        self.assertEqual(result['fi'], {'field1': 'value'}, "should contain the new filter")
+
+    def test_generate_query_per_query_type(self):
+        """
+        Test that `generate()` emits everything that was set, whatever the query type.
+
+        This test ensures that INSERT and DELETE queries keep the fields and filters set on them,
+        and that the query type code matches `ZTeraDBQueryType`.
+
+        Steps:
+        1. Build an INSERT query with fields and a filter and generate it.
+        2. Assert that both the fields and the filter are part of the generated query.
+        3. Build a DELETE query with fields and a filter and generate it.
+        4. Assert that both the fields and the filter are part of the generated query.
+        """
+        # Step 1: Build and generate an INSERT query
+        result = ZTeraDBQuery("my_schema_hash").insert().fields(field1=1).filter(field2=2).generate()
+
+        # Step 2: Assert that nothing is dropped
+        self.assertEqual(result, {'sh': 'my_schema_hash', 'qt': ZTeraDBQueryType.INSERT.value,
+                                  'fl': {'field1': 1}, 'fi': {'field2': 2}},
+                         "should generate insert query with fields and filters")
+
+        # Step 3: Build and generate a DELETE query
+        result = ZTeraDBQuery("my_schema_hash").delete().fields(field1=1).filter(field2=2).generate()
+
+        # Step 4: Assert that nothing is dropped
+        self.assertEqual(result, {'sh': 'my_schema_hash', 'qt': ZTeraDBQueryType.DELETE.value,
+                                  'fl': {'field1': 1}, 'fi': {'field2': 2}},
+                         "should generate delete query with fields and filters")
+
+    def test_query_string_representation(self):
+        """
+        Test that `str()` of a query reflects its schema name and database id.
+
+        Steps:
+        1. Assert that a query with a database id renders as "database_id.schema_name".
+        2. Assert that a query without a database id renders as the schema name.
+        3. Set a database id and assert that the string representation follows it.
+        """
+        # Step 1: Query created with a database id
+        self.assertEqual(str(self.query), "database_id.my_schema_hash", "should include the database id")
+
+        # Step 2: Query created without a database id
+        query = ZTeraDBQuery("my_schema_hash")
+        self.assertEqual(str(query), "my_schema_hash", "should only contain the schema name")
+        self.assertIsNone(query.database_id, "should not have a database id")
+
+        # Step 3: Set the database id afterwards
+        query.set_database_id("other_database")
+        self.assertEqual(str(query), "other_database.my_schema_hash", "should follow the new database id")
+
+    def test_sort_accepts_string_orders(self):
+        """
+        Test that `sort()` accepts "asc"/"desc" strings as sort orders.
+
+        Steps:
+        1. Sort by fields using upper and lower case string orders.
+        2. Assert that they map to `Sort.ASC` and `Sort.DESC`.
+        """
+        # Step 1: Sort with string orders
+        self.query.sort(field1="asc", field2="DESC", field3="ASC", field4="desc")
+
+        # Step 2: Assert that the orders are normalized
+        self.assertEqual(self.query.get_sort(),
+                         {'field1': Sort.ASC, 'field2': Sort.DESC, 'field3': Sort.ASC, 'field4': Sort.DESC},
+                         "should normalize string sort orders")
+
+    def test_add_filter_conditions_in_bulk(self):
+        """
+        Test that `filter_conditions_add()` adds several filter conditions at once.
+
+        Steps:
+        1. Add two filter conditions with `filter_conditions_add()`.
+        2. Assert that both conditions are stored in order.
+        3. Pass an invalid condition along with a valid one.
+        4. Assert that a ValueError is raised and no condition is added.
+        """
+        # Step 1: Add two filter conditions at once
+        first, second = ZTGTE(["age", 30]), ZTLT(["age", 60])
+        self.query.filter_conditions_add(first, second)
+
+        # Step 2: Assert that both conditions are stored
+        self.assertEqual(self.query.filter_conditions, [first.get_fields(), second.get_fields()],
+                         "should add all filter conditions")
+
+        # Step 3: Pass an invalid condition
+        with self.assertRaises(ValueError) as context:
+            self.query.filter_conditions_add(ZTGTE(["age", 1]), "invalid")
+
+        # Step 4: Assert the error and that the query is unchanged
+        self.assertEqual(str(context.exception), "'filter_condition' must be an instance of ZTeraDBFilterCondition")
+        self.assertEqual(len(self.query.filter_conditions), 2, "should not add any condition")
+
+    def test_read_missing_field(self):
+        """
+        Test reading fields that are not set.
+
+        This test ensures that `get_field()` returns `None` for a missing field, while reading a
+        missing field as an attribute raises an `AttributeError`.
+
+        Steps:
+        1. Set a field and read it back with `get_field()`.
+        2. Assert that `get_field()` returns `None` for a missing field.
+        3. Assert that reading a missing field as an attribute raises an `AttributeError`.
+        """
+        # Step 1: Set a field and read it back
+        self.query.field("field1", "hello")
+        self.assertEqual(self.query.get_field("field1"), "hello", "should read the field")
+
+        # Step 2: A missing field reads as None
+        self.assertIsNone(self.query.get_field("field2"), "should return None for a missing field")
+
+        # Step 3: A missing attribute raises an AttributeError
+        with self.assertRaises(AttributeError):
+            self.query.field2
+
+    def test_shared_related_query_is_generated_once(self):
+        """
+        Test that a sub-query referenced by several related fields is generated once.
+
+        Steps:
+        1. Build a SELECT sub-query and reference it from two related fields of two queries.
+        2. Assert that every reference holds the same generated dictionary.
+        3. Change the sub-query and assert that it generates a new dictionary.
+        """
+        # Step 1: Reference the same sub-query from several related fields
+        related_query = ZTeraDBQuery("related_schema").select()
+        self.query.select().related_field(first=related_query, second=related_query)
+        other_query = ZTeraDBQuery("other_schema").select().related_field(first=related_query)
+
+        # Step 2: Assert that the generated sub-query is shared
+        generated = related_query.generate()
+        self.assertIs(self.query.related_fields['first'], generated, "should reuse the generated sub-query")
+        self.assertIs(self.query.related_fields['second'], generated, "should reuse the generated sub-query")
+        self.assertIs(other_query.related_fields['first'], generated, "should reuse the generated sub-query")
+
+        # Step 3: A change to the sub-query generates a new dictionary
+        related_query.limit(0, 10)
+        self.assertIsNot(related_query.generate(), generated, "should regenerate the changed sub-query")
+
+    def test_invalid_limit_end_type(self):
+        """
+        Test that a non-integer limit end is reported with its own value.
+
+        Steps:
+        1. Call the `limit()` method with a valid start and a string end.
+        2. Assert that the error message names the invalid end value.
+        """
+        # Step 1: Call limit() with an invalid end
+        with self.assertRaises(ValueError) as context:
+            self.query.limit(0, 'value')
+
+        # Step 2: Assert that the message names the end value
+        self.assertEqual(str(context.exception), "Limit 'value' must be an integer")
+
+    def test_query_objects_have_no_instance_dict(self):
+        """
+        Test that the query building blocks are slotted.
+
+        Steps:
+        1. Create a query, a sort, a limit and a query layout instance.
+        2. Assert that none of them carries a per-instance `__dict__`.
+        """
+        # Step 1: Create the objects
+        objects = (self.query, Sort("field1", Sort.ASC), Limit(0, 10),
+                   Query(*(None,) * len(Query._fields)))
+
+        # Step 2: Assert that they have no instance dictionary
+        for obj in objects:
+            self.assertFalse(hasattr(obj, '__dict__'), f"{type(obj).__name__} should not have an instance dictionary")
+            self.assertNotIn('__dict__', dir(type(obj)), f"{type(obj).__name__} should not define __dict__")
+
+    def test_throw_error_for_invalid_sort_order(self):
+        """
+        Test that `sort()` rejects sort orders other than ascending and descending.
+
+        Steps:
+        1. Call `sort()` with a valid field and a field sorted by 0.
+        2. Assert that a `ValueError` is raised with the expected message.
+        3. Assert that the valid field was not added either.
+        """
+        # Step 1: Call sort() with an invalid order
+        with self.assertRaises(ValueError) as context:
+            self.query.sort(field1=1, field2=0)
+
+        # Step 2: Assert the error message
+        self.assertEqual(str(context.exception), "Sort order '0' of 'field2' must be 1 (ascending) or -1 (descending)")
+
+        # Step 3: Assert that the query is unchanged
+        self.assertEqual(self.query.get_sort(), dict(), "should not add any sort order")
+
+    def test_skip_empty_filter_conditions(self):
+        """
+        Test that filter conditions without any filter are not added to the query.
+
+        Steps:
+        1. Add an empty filter condition with `filter_condition()`.
+        2. Add an empty and a valid filter condition with `filter_conditions_add()`.
+        3. Assert that only the valid condition is stored.
+        """
+        # Step 1: Add an empty filter condition
+        self.query.filter_condition(ZTeraDBFilterCondition())
+
+        # Step 2: Add an empty and a valid filter condition at once
+        condition = ZTGTE(["age", 30])
+        self.query.filter_conditions_add(ZTeraDBFilterCondition(), condition)
+
+        # Step 3: Assert that only the valid condition is stored
+        self.assertEqual(self.query.filter_conditions, [condition.get_fields()], "should skip empty conditions")
+
+    def test_sort_with_positional_arguments(self):
+        """
+        Test that `sort()` accepts `Sort` instances and dictionaries positionally.
+
+        Steps:
+        1. Call `sort()` with a `Sort` instance, a dictionary and a keyword argument.
+        2. Assert that all the sort orders are stored in the given order.
+        3. Call `sort()` with an invalid positional argument and assert that a `ValueError` is raised.
+        """
+        # Step 1: Mix positional and keyword sorts
+        self.query.sort(Sort("field1", Sort.ASC), {"field2": -1}, field3="asc")
+
+        # Step 2: Assert the stored sort orders
+        self.assertEqual(list(self.query.get_sort().items()),
+                         [('field1', Sort.ASC), ('field2', Sort.DESC), ('field3', Sort.ASC)],
+                         "should store positional and keyword sort orders")
+
+        # Step 3: An invalid positional argument is rejected
+        with self.assertRaises(ValueError) as context:
+            self.query.sort("field4")
+
+        self.assertEqual(str(context.exception), "'field4' must be an instance of Sort or a dictionary")
+
+    def test_getters_return_plain_containers_when_empty(self):
+        """
+        Test that the getters return a plain dict or list while nothing has been set.
+
+        Steps:
+        1. Call every getter on a query without fields, filters, conditions or sort.
+        2. Assert that each result is an empty dict or list.
+        3. Assert that the results can be serialized to JSON.
+        """
+        # Step 1: Call the getters
+        results = [self.query.fields(), self.query.filters(), self.query.related_fields,
+                   self.query.get_sort(), self.query.filter_conditions]
+
+        # Step 2: Assert the types
+        self.assertEqual([type(result) for result in results], [dict, dict, dict, dict, list])
+        self.assertEqual(self.query.filter_conditions, [])
+
+        # Step 3: Assert that they serialize
+        self.assertEqual(json.dumps(results), '[{}, {}, {}, {}, []]')
+
+    def test_field_validates_like_fields(self):
+        """
+        Test that `field()` rejects the same names and values as `fields()`.
+
+        Steps:
+        1. Set a field with a blank name and assert that a `ValueError` is raised.
+        2. Set a field with an object value and assert that a `ValueError` is raised.
+        3. Assert that nothing was stored and a valid field is still accepted.
+        """
+        # Step 1: Blank field name
+        with self.assertRaises(ValueError) as context:
+            self.query.field(" ", 1)
+        self.assertEqual(str(context.exception), "' ' must be a schema field")
+
+        # Step 2: Object value
+        with self.assertRaises(ValueError) as context:
+            self.query.field("field1", [1])
+        self.assertEqual(str(context.exception), "'[1]' must not be any object.")
+
+        # Step 3: Nothing stored, valid fields still work
+        self.assertEqual(self.query.fields(), {})
+        self.assertEqual(self.query.field("field1", 1).fields(), {"field1": 1})
+
+    def test_sort_does_not_change_generated_queries(self):
+        """
+        Test that `sort()` leaves already generated queries untouched.
+
+        Steps:
+        1. Embed a sorted sub-query as a related field of a parent query.
+        2. Add another sort order to the sub-query.
+        3. Assert that the parent query still holds the previous sort orders.
+        """
+        # Step 1: Embed a sorted sub-query
+        sub_query = ZTeraDBQuery("related_schema").select().sort(field1=1)
+        self.query.select().related_field(related=sub_query)
+        generated = self.query.generate()
+
+        # Step 2: Sort the sub-query again
+        sub_query.sort(field2=-1)
+
+        # Step 3: The embedded snapshot is unchanged
+        self.assertEqual(generated['rf']['related']['st'], {'field1': 1}, "should keep the embedded sort orders")
+        self.assertEqual(sub_query.get_sort(), {'field1': 1, 'field2': -1})
+
+    def test_sort_with_unhashable_order(self):
+        """
+        Test that `Sort` falls back to descending order for an unhashable order.
+        """
+        self.assertEqual(Sort("field1", [1]).sort_order, Sort.DESC, "should sort descending")
+        self.assertEqual(Sort("field1", {"order": 1}).to_dict(), {"field1": Sort.DESC})
+
 
 if __name__ == '__main__':
     unittest.main()
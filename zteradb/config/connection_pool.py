@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from typing import Dict
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionPool:
     """
     Manages and validates the minimum and maximum connection limits.
@@ -16,16 +17,24 @@ class ConnectionPool:
     def has_max_conn(self) -> bool:
         return self.max is not None
 
+    @classmethod
+    def from_dict(cls, connection_pool: Dict[str, int]) -> "ConnectionPool":
+        """
+        Builds a ConnectionPool from a {"min": ..., "max": ...} dictionary.
+        Missing keys fall back to 0.
+        """
+        return cls(min=connection_pool.get("min", 0), max=connection_pool.get("max", 0))
+
     def set_min_max_connections(self, min_conn, max_conn):
         self.min = min_conn
         self.max = max_conn
 
     def is_valid(self):
         """Validates connection pool constraints."""
-        if not isinstance(self.min, int):
+        if type(self.min) is not int:
             raise ValueError("min connection must be integer")
 
-        if not isinstance(self.max, int):
+        if type(self.max) is not int:
             raise ValueError("max connection must be integer")
 
         if self.min > self.max:
@@ -35,4 +35,8 @@ class ENVS(enum.Enum):
         Returns:
             List[str]: A list of environment names as strings.
         """
-        return [env.name for env in cls]
\ No newline at end of file
+        return list(cls._NAMES)
+
+
+# The member names never change, list() copies them from this tuple.
+ENVS._NAMES = tuple(env.name for env in ENVS)
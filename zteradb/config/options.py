@@ -3,14 +3,12 @@ from typing import Optional, Union, Dict
 
 from .connection_pool import ConnectionPool
 
-@dataclass
+@dataclass(slots=True)
 class Options:
     """
     A class to define overall options for ZTeraDB, holding the connection pool settings.
     """
-    connection_pool: Union[ConnectionPool, Dict[str, int]] = field(
-        default_factory=lambda: ConnectionPool()
-    )
+    connection_pool: Union[ConnectionPool, Dict[str, int]] = field(default_factory=ConnectionPool)
 
     def __post_init__(self):
         """
@@ -18,15 +16,11 @@ class Options:
         it automatically unpacks it into a ConnectionPool instance.
         """
         if isinstance(self.connection_pool, dict):
-            # Gracefully handle missing keys by falling back to 0 or defaults
-            min_val = self.connection_pool.get("min", 0)
-            max_val = self.connection_pool.get("max", 0)
-
-            self.connection_pool = ConnectionPool(min=min_val, max=max_val)
+            self.connection_pool = ConnectionPool.from_dict(self.connection_pool)
 
     def is_valid(self):
         """Validates components downstream."""
-        if self.connection_pool:
+        if self.connection_pool is not None:
             if not isinstance(self.connection_pool, ConnectionPool):
                 raise ValueError(
                     "connection_pool must be a valid ConnectionPool instance or matching dictionary structure.")
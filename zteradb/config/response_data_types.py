@@ -10,7 +10,7 @@ class ResponseDataTypes(enum.Enum):
         json (str): The string value for the JSON response format, which is the default format used by ZTeraDB.
     """
     # JSON format for response data. This is the default format supported by ZTeraDB.
-    JSON: str = "json"
+    JSON = "json"
 
     @classmethod
     def list(cls):
@@ -23,4 +23,8 @@ class ResponseDataTypes(enum.Enum):
         Returns:
             List[str]: A list of response data format names.
         """
-        return [response_data_type.name for response_data_type in cls]
\ No newline at end of file
+        return list(cls._NAMES)
+
+
+# The member names never change, list() copies them from this tuple.
+ResponseDataTypes._NAMES = tuple(response_data_type.name for response_data_type in ResponseDataTypes)
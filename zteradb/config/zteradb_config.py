@@ -19,15 +19,39 @@
 # -----------------------------------------------------------------------------
 
 import enum
+import sys
+from operator import attrgetter
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Union
 from .response_data_types import ResponseDataTypes
 from .envs import ENVS
 from .options import Options
 
+# Accepted environment and response data type values mapped to their interned form,
+# with their error message listings.
+_ENV_VALUES = {env.value: sys.intern(env.value) for env in ENVS}
+_ENV_VALUES_TEXT = ", ".join(env.value for env in ENVS)
+_RDT_VALUES = {
+    response_data_type.value: sys.intern(response_data_type.value) for response_data_type in ResponseDataTypes
+}
+_RDT_VALUES_TEXT = ", ".join(response_data_type.value for response_data_type in ResponseDataTypes)
 
-@dataclass
-class ZTeraDBConfig:
+# (field name, getter) pairs for the string fields, with the getters built once.
+_REQUIRED_STR_FIELDS = tuple((name, attrgetter(name)) for name in ("client_key", "access_key", "secret_key"))
+_OPTIONAL_STR_FIELDS = tuple((name, attrgetter(name)) for name in ("database_id",))
+
+
+class _ValidationState:
+    """
+    Holds the cached validation result of ZTeraDBConfig in a slot outside of its
+    dataclass fields, so it stays out of `fields()`, `asdict()`, `repr()` and `==`.
+    """
+    __slots__ = ("_validated",)
+
+
+@dataclass(slots=True)
+class ZTeraDBConfig(_ValidationState):
     """
     Configuration class for ZTeraDB client that holds and validates key authentication
     details and optional settings for connecting to the ZTeraDB server.
@@ -55,6 +79,15 @@ class ZTeraDBConfig:
     use_tls: Optional[bool] = False
     verify_tls_host: Optional[bool] = False
 
+    def __setattr__(self, name, value):
+        """
+        Sets the attribute and, for any configuration field, drops the cached
+        validation result so the next `is_valid()` call checks again.
+        """
+        object.__setattr__(self, name, value)
+        if name != "_validated":
+            object.__setattr__(self, "_validated", False)
+
     def __post_init__(self):
         """
         Automatically runs right after object instantiation to safely normalize
@@ -76,12 +109,20 @@ class ZTeraDBConfig:
         - response_data_type
         - options
 
+        Types are checked exactly, so `str`/`int` subclasses (other than enum members
+        for env and response_data_type) must be converted by the caller first.
+        Once validated, the field checks are skipped until a field is reassigned. The options
+        can be changed in place, so they are validated on every call.
+
         :raises ValueError: If any of the attributes are invalid, a descriptive error message is raised.
         """
-        self._validate_string_keys()
-        self._validate_types()
-        self._validate_env_key()
-        self._validate_response_data_type_key()
+        if not self._validated:
+            self._validate_string_keys()
+            self._validate_types()
+            self._validate_env_key()
+            self._validate_response_data_type_key()
+            object.__setattr__(self, "_validated", True)
+
         self._validate_options()
 
     @property
@@ -98,67 +139,70 @@ class ZTeraDBConfig:
         return self.options is not None
 
     def _validate_string_keys(self):
-        """Validates critical string attributes to ensure they are non-empty strings."""
-        for field_name in ("client_key", "access_key", "secret_key"):
-            val = getattr(self, field_name)
-            if not isinstance(val, str) or not val.strip():
+        """Validates the string attributes: required ones must be non-empty, optional ones strings if set."""
+        for field_name, get_value in _REQUIRED_STR_FIELDS:
+            val = get_value(self)
+            if type(val) is not str or not val.strip():
                 raise ValueError(f"'{field_name}' must be a non-empty string.")
 
+        for field_name, get_value in _OPTIONAL_STR_FIELDS:
+            val = get_value(self)
+            if val is not None and type(val) is not str:
+                raise ValueError(f"{field_name} must be a string.")
+
     def _validate_types(self):
         """Validates straightforward types and flags."""
-        if self.database_id and not isinstance(self.database_id, str):
-            raise ValueError(f"database_id must be a string.")
 
-        if self.connect_timeout is not None and not isinstance(self.connect_timeout, int):
+        if self.connect_timeout is not None and type(self.connect_timeout) is not int:
             raise ValueError(f"connect_timeout must be an integer.")
 
-        if not isinstance(self.use_tls, bool):
+        if type(self.use_tls) is not bool:
             raise ValueError("use_tls must be a boolean value.")
 
-        if not isinstance(self.verify_tls_host, bool):
+        if type(self.verify_tls_host) is not bool:
             raise ValueError("verify_tls_host must be a boolean value.")
 
     def _validate_env_key(self):
-        """Validates and extracts the environment enum value securely."""
-        if isinstance(self.env, ENVS):
-            self.env = self.env.value
-            return
-
-        try:
-            # Check string representation validity
-            ENVS(self.env)
-        except ValueError:
-            valid_envs = ", ".join([e.value for e in ENVS])
+        """Validates the environment and stores its interned string value."""
+        env = self.env.value if isinstance(self.env, ENVS) else self.env
+        canonical_env = _ENV_VALUES.get(env) if type(env) is str else None
+        if canonical_env is None:
             raise ValueError(
-                f"'{self.env}' is not a valid environment key. Valid options are: {valid_envs}"
+                f"'{self.env}' is not a valid environment key. Valid options are: {_ENV_VALUES_TEXT}"
             )
 
+        self.env = canonical_env
+
     def _validate_response_data_type_key(self):
-        """Validates and extracts the response data type configuration."""
-        if isinstance(self.response_data_type, ResponseDataTypes):
-            self.response_data_type = self.response_data_type.value
-            return
-
-        try:
-            ResponseDataTypes(self.response_data_type)
-        except ValueError:
-            valid_types = ", ".join([r.value for r in ResponseDataTypes])
+        """Validates the response data type and stores its interned string value."""
+        response_data_type = (
+            self.response_data_type.value
+            if isinstance(self.response_data_type, ResponseDataTypes)
+            else self.response_data_type
+        )
+        canonical_response_data_type = (
+            _RDT_VALUES.get(response_data_type) if type(response_data_type) is str else None
+        )
+        if canonical_response_data_type is None:
             raise ValueError(
                 f"'{self.response_data_type}' is an invalid response data type. "
-                f"Valid choices are: {valid_types}"
+                f"Valid choices are: {_RDT_VALUES_TEXT}"
             )
 
+        self.response_data_type = canonical_response_data_type
+
     def _validate_options(self):
         """Ensures options object conforms to constraints and delegates internal validation."""
-        if self.options:
+        if self.options is not None:
             if not isinstance(self.options, Options):
                 raise ValueError("options must be a valid Options instance.")
             self.options.is_valid()
 
-@dataclass
+@dataclass(slots=True)
 class ResponseType:
     pass
 
 
-# Global ZTERADB_CONF. it contains global ZTeraDBConfig object
-ZTERADB_CONF: Dict[str, Any] = {}
+# Global ZTERADB_CONF. It holds the default ZTeraDBConfig object for the current context;
+# set it with ZTERADB_CONF.set(config) and read it with ZTERADB_CONF.get().
+ZTERADB_CONF: ContextVar[Optional[ZTeraDBConfig]] = ContextVar("ZTERADB_CONF", default=None)
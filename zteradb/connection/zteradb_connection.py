@@ -370,6 +370,25 @@ class ZTeraDBConnectionManager:
         # Put the provided connection back into the connection pool to be reused.
         await self.connections.put(connection)
 
+    async def discard_connection(self, connection):
+        """
+        Closes a connection instead of releasing it back to the connection pool.
+
+        This method is used for a connection whose query was interrupted before the
+        server finished sending the result. The rest of that result may still arrive
+        on the connection, so it can not be reused by another query.
+
+        Example usage:
+            await connection_manager.discard_connection(connection)
+
+        Args:
+            connection (ZTeraDBClientProtocol): The connection to be closed.
+        """
+        if connection is None:
+            return
+
+        await connection.close()
+
     async def close(self):
         """
         Closes all connections in the connection pool.
@@ -408,18 +427,18 @@ class ZTeraDBConnectionAsync:
 
         This constructor initializes a `ZTeraDBConnectionManager` to handle the connection
         to the TeraDB instance. If no specific configuration is provided, the default global
-        configuration (`zteradb_config.ZTERADB_CONF`) is used.
+        configuration (`zteradb_config.ZTERADB_CONF.get()`) is used.
 
         :param: host (str): The host address of the TeraDB instance.
         :param: port (int): The port on which the TeraDB instance is listening.
         :param: zteradb_conf (Optional[zteradb_config.ZTeraDBConfig]): The optional configuration for TeraDB connection.
-                If not provided, the global `zteradb_config.ZTERADB_CONF` is used.
+                If not provided, the global `zteradb_config.ZTERADB_CONF.get()` is used.
 
         :raises:
             ValueError: If the `host` or `port` are not of the correct type.
         """
         # Use the provided configuration or fallback to the default global configuration
-        zteradb_conf = zteradb_conf if zteradb_conf else zteradb_config.ZTERADB_CONF
+        zteradb_conf = zteradb_conf if zteradb_conf is not None else zteradb_config.ZTERADB_CONF.get()
 
         # Initialize the connection manager with the specified or default configuration
         self.connection_manager = ZTeraDBConnectionManager(
@@ -506,6 +525,62 @@ class ZTeraDBConnectionAsync:
 
         return await query_iterator.fetch_one()
 
+    async def run_many(self, queries, query_timeout=None):
+        """
+        Executes several queries against the TeraDB instance concurrently.
+
+        Each query runs through `run()` on its own pooled connection, and the queries are
+        awaited together with `asyncio.gather`, so the total time is close to that of the
+        slowest query instead of the sum of all of them. At most `max_connections` queries
+        run at once when the connection pool defines a maximum.
+
+        :params: queries (Iterable[ZTeraDBQuery]): The queries to be executed.
+        :params: query_timeout (Optional[float]): The timeout applied to every query.
+
+        :returns: list: One result per query, in the order of `queries`. SELECT queries
+                        give the list of all their rows, other queries give their single result.
+
+        :raises:
+            ValueError: If one of the queries is not an instance of `ZTeraDBQuery`.
+            Exception: The first error raised by one of the queries. The queries still running
+                       are cancelled first, which closes their connections instead of returning
+                       them to the pool with the rest of their result still pending.
+
+        Example usage:
+            results = await connection.run_many([query_1, query_2, query_3])
+        """
+        queries = list(queries)
+
+        # Validate every query before any request is sent
+        for query in queries:
+            if not isinstance(query, ZTeraDBQuery):
+                raise ValueError(f"{query} is not an instance of ZTeraDBQuery")
+
+        # Do not open more connections than the pool allows
+        semaphore = asyncio.Semaphore(self.connection_manager.max_connections or len(queries) or 1)
+
+        async def run_query(query):
+            async with semaphore:
+                result = await self.run(query, query_timeout=query_timeout)
+
+                if query.is_select_query:
+                    return [row async for row in result]
+
+                return result
+
+        tasks = [asyncio.ensure_future(run_query(query)) for query in queries]
+
+        try:
+            return await asyncio.gather(*tasks)
+
+        except BaseException:
+            # Stop the other queries and wait for them to close their connections
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def close(self):
         """
         Asynchronously closes all active connections managed by the connection manager.
@@ -28,23 +28,24 @@ class ZTeraBaseError(Exception):
     Attributes:
         message (str): The error message associated with the exception.
     """
+    __slots__ = ()
 
-    def __init__(self, message):
+    @property
+    def message(self):
         """
-        Initializes the ZTeraBaseError with a custom message.
+        The error message the exception was raised with, read from `args`.
 
-        :param message: str - The error message to be associated with the exception.
+        :return: str - The error message associated with the exception.
         """
-        self.message = message
-        super().__init__(self.message)
+        return self.args[0] if self.args else ''
 
-    def __dict__(self):
+    def to_dict(self):
         """
-        Return the error message when the exception is serialized to a dictionary.
+        Return the exception as a dictionary, e.g. for JSON serialization.
 
-        :return: str - The error message associated with the exception.
+        :return: dict - A dictionary holding the error message.
         """
-        return self.message
+        return {'message': self.message}
 
 
 class ZTeraDBError(ZTeraBaseError):
@@ -57,13 +58,7 @@ class ZTeraDBError(ZTeraBaseError):
     Example usage:
         raise ZTeraDBError("An error occurred while executing error")
     """
-    def __init__(self, message):
-        """
-        Initializes the ZTeraDBError with a custom message.
-
-        :param message: str - The error message to be associated with the exception.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
 
 class ZTeraDBQueryError(ZTeraDBError):
@@ -76,13 +71,7 @@ class ZTeraDBQueryError(ZTeraDBError):
     Example usage:
         raise ZTeraDBQueryError("An error occurred while executing error")
     """
-    def __init__(self, message):
-        """
-        Initializes the ZTeraDBQueryError with a custom message.
-
-        :param message: str - The error message to be associated with the exception.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
 
 class ZTeraDBConditionError(ZTeraDBError):
@@ -95,13 +84,7 @@ class ZTeraDBConditionError(ZTeraDBError):
     Example usage:
         raise ZTeraDBQueryError("An error occurred while executing error")
     """
-    def __init__(self, message):
-        """
-        Initializes the ZTeraDBQueryError with a custom message.
-
-        :param message: str - The error message to be associated with the exception.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
 
 class NoResponseDataError(ZTeraBaseError):
@@ -115,14 +98,7 @@ class NoResponseDataError(ZTeraBaseError):
     Example usage:
         raise NoDataError("No data available for the query.")
     """
-
-    def __init__(self, message):
-        """
-        Initializes the NoDataError with a custom message.
-
-        :param message: str - The error message to be associated with the exception.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
 
 class QueryComplete(ZTeraBaseError):
@@ -133,17 +109,17 @@ class QueryComplete(ZTeraBaseError):
     has been successfully executed. It serves as a signal that the query completed
     without errors.
 
+    Deprecated: the client no longer raises it; query completion is signalled by
+    returning the `QUERY_DONE` sentinel. Kept for backward compatibility.
+
     Example usage:
         raise QueryComplete("Query completed successfully.")
     """
+    __slots__ = ()
 
-    def __init__(self, message):
-        """
-        Initializes the QueryComplete exception with a custom message.
 
-        :param message: str - The error message to be associated with the exception.
-        """
-        super().__init__(message)
+# Sentinel returned instead of raising QueryComplete when a query has no more results.
+QUERY_DONE = object()
 
 
 class AuthenticationFailed(ZTeraBaseError):
@@ -157,11 +133,4 @@ class AuthenticationFailed(ZTeraBaseError):
     Example usage:
         raise AuthenticationFailed("An error occurred while authenticating.")
     """
-
-    def __init__(self, message):
-        """
-        Initializes the AuthenticationFailed exception with a custom message.
-
-        :param message: str - The error message to be associated with the exception.
-        """
-        super().__init__(message)
+    __slots__ = ()
@@ -36,6 +36,7 @@ class DataManager:
     """
     struct_fmt = "!I"
     BUFFER_SIZE = struct.calcsize(struct_fmt)
+    _header_struct = struct.Struct(struct_fmt)
 
     def __init__(self, data: bytes):
         """
@@ -97,6 +98,19 @@ class DataManager:
         if data:
             return struct.unpack(cls.struct_fmt, data[:cls.BUFFER_SIZE])
 
+    @classmethod
+    def unpack_length(cls, buffer, offset: int = 0):
+        """
+        Reads the payload length from a frame header without slicing the buffer.
+
+        :param buffer: Any buffer (bytes, bytearray or memoryview) holding the header.
+        :param offset: The position of the header within the buffer.
+        :type offset: int
+        :return: The payload length announced by the header.
+        :rtype: int
+        """
+        return cls._header_struct.unpack_from(buffer, offset)[0]
+
     def decode(self):
         """
         Decodes the byte data into a string using the default UTF-8 encoding.
@@ -21,7 +21,7 @@
 import enum
 
 
-class RequestType(enum.Enum):
+class RequestType(enum.IntEnum):
     """
     Enum representing various request types that can be made to the ZTeraDB system.
 
@@ -97,7 +97,7 @@ class RequestType(enum.Enum):
         return self.value
 
 
-class ResponseType(enum.Enum):
+class ResponseType(enum.IntEnum):
     """
     Enum representing various response types that correspond to different requests
     made to the ZTeraDB system.
@@ -0,0 +1,30 @@
+# -----------------------------------------------------------------------------
+# File: zteradb_request_types_fast.py
+# Description: This file exposes the `RequestType` and `ResponseType` codes used
+#              on the connection hot paths as plain integer constants, where
+#              comparing the wire integers against module constants avoids any
+#              enum attribute lookup. The values are taken from the enums, which
+#              remain the public API. Add a constant here when a hot path needs it.
+#
+# License: ZTeraDB
+# Copyright (c) 2025 ZTeraDB
+#
+# The code in this file is proprietary and confidential. It may not be shared,
+# re-engineered, reverse-engineered, modified, or distributed in any way without
+# express written permission from the copyright holder.
+#
+# All rights are reserved to the copyright holder.
+#
+# License URL: https://zteradb.com/licence
+# -----------------------------------------------------------------------------
+
+from typing import Final
+from zteradb.lib.zteradb_request_types import RequestType, ResponseType
+
+
+# Request type codes
+REQUEST_CANCEL: Final[int] = RequestType.CANCEL.value
+REQUEST_QUERY: Final[int] = RequestType.QUERY.value
+
+# Response type codes
+RESPONSE_QUERY_COMPLETE: Final[int] = ResponseType.QUERY_COMPLETE.value
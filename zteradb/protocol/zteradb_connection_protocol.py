@@ -27,13 +27,16 @@ import ssl
 from zteradb.query.zteradb_query import ZTeraDBQuery
 from zteradb.auth.zteradb_auth import ZTeraDBClientAuth, ZTeraDBServerAuth
 from zteradb.protocol.zteradb_protocol import ZTeraDBTCPProtocol
-from zteradb.lib import zteradb_request_types
-from zteradb.exceptions.zteradb_exception import QueryComplete, NoResponseDataError, AuthenticationFailed, ZTeraBaseError, ZTeraDBQueryError
+from zteradb.lib.zteradb_request_types_fast import REQUEST_QUERY, REQUEST_CANCEL, RESPONSE_QUERY_COMPLETE
+from zteradb.exceptions.zteradb_exception import QUERY_DONE, NoResponseDataError, AuthenticationFailed, ZTeraBaseError, ZTeraDBQueryError
 from zteradb.helper.zteradb_common import ZTeraDBResponseData
 
 
 log = logging.getLogger()
 
+# The cancel request never changes, so it is serialized once.
+_CANCEL_REQUEST = json.dumps({"query": "cancel", "request_type": REQUEST_CANCEL})
+
 
 class ZTeraDBClientProtocol(ZTeraDBTCPProtocol):
     """
@@ -129,6 +132,7 @@ class ZTeraDBClientProtocol(ZTeraDBTCPProtocol):
                 connect_timeout=30
             )
         """
+        super().__init__()
         self._host = host
         self._port = port
         self.zteradb_conf = zteradb_conf
@@ -228,9 +232,9 @@ class ZTeraDBClientProtocol(ZTeraDBTCPProtocol):
         This method:
         1. Creates an SSL context if TLS is enabled in the configuration.
         2. Configures SSL verification options based on the user's settings.
-        3. Opens a network connection to the configured host and port.
-        4. Stores the asyncio StreamReader and StreamWriter objects for data exchange.
-        5. Logs information about the established connection (TLS version and cipher suite).
+        3. Opens a network connection to the configured host and port, using this
+           instance as the protocol which receives the incoming frames.
+        4. Logs information about the established connection (TLS version and cipher suite).
 
         Raises:
             ssl.SSLError: If SSL/TLS setup or verification fails.
@@ -239,8 +243,7 @@ class ZTeraDBClientProtocol(ZTeraDBTCPProtocol):
             OSError: For other socket-related errors.
 
         Attributes:
-            _reader (asyncio.StreamReader): Stream reader for receiving data.
-            _writer (asyncio.StreamWriter): Stream writer for sending data.
+            _transport (asyncio.Transport): Transport for sending and receiving data.
             zteradb_conf (object): Configuration object containing TLS and connection settings.
             _host (str): Hostname or IP address of the ZTeraDB server.
             _port (int): TCP port number of the ZTeraDB server.
@@ -264,15 +267,15 @@ class ZTeraDBClientProtocol(ZTeraDBTCPProtocol):
                 ssl_context.verify_mode = ssl.CERT_NONE
 
         # Establishing the connection to the ZTeraDB server.
-        self._reader, self._writer = await asyncio.open_connection(
-            host=self._host, port=self._port, ssl=ssl_context
+        await asyncio.get_running_loop().create_connection(
+            lambda: self, host=self._host, port=self._port, ssl=ssl_context
         )
 
         self._is_connected = True
 
         if ssl_context:
             # Retrieve SSL connection details for logging
-            ssl_object = self._writer.get_extra_info("ssl_object")
+            ssl_object = self._transport.get_extra_info("ssl_object")
             log.debug(f"✅ Connected using {ssl_object.version()} with {ssl_object.cipher()}")
 
         else:
@@ -347,7 +350,7 @@ class ZTeraDBClientProtocol(ZTeraDBTCPProtocol):
                         # If authentication is valid, parse the response and update the connection
                         server_auth: ZTeraDBServerAuth = self.parse_server_auth_response(response.data)
                         self.set_server_auth(server_auth)
-                        super().__init__(reader=self.reader, writer=self.writer)
+                        self.set_is_authenticated(True)
                         self._is_connected = True
                         return True
 
@@ -397,7 +400,7 @@ class ZTeraDBClientProtocol(ZTeraDBTCPProtocol):
         It performs the following actions:
         1. Converts the `response_data` to JSON if it's not already in JSON format.
         2. Checks for errors in the response and raises an exception if any are found.
-        3. If the response indicates that the query is complete, raises a `QueryComplete` exception.
+        3. If the response indicates that the query is complete, returns the `QUERY_DONE` sentinel.
         4. Returns the data if the query is successful and the response contains data.
 
         :param response_data: The response data from the server after executing a ZTeraDB query.
@@ -419,14 +422,13 @@ class ZTeraDBClientProtocol(ZTeraDBTCPProtocol):
         :raises: Exception - If the response contains an error.
             - Example: If the `"error"` field is `true`, an exception is raised with the error message in `"data"`.
 
-        :raises: QueryComplete - If the response indicates that the query execution is complete.
-            - Example: If the `"response_code"` is `QUERY_COMPLETE` (a constant value representing query completion), it raises the `QueryComplete` exception.
-
         :raises: NoResponseDataError - If the response contains no data.
             - Example: If the `"data"` field is missing or empty, the method raises the `NoResponseDataError` exception.
 
         :return: dict - If the query is successful and the response contains data, it returns the `"data"` part of the response.
             - Example: If the response contains `"data": {"id": 1, "name": "John"}`, the method will return `{"id": 1, "name": "John"}`.
+            If the `"response_code"` is `QUERY_COMPLETE`, it returns the `QUERY_DONE` sentinel instead,
+            so callers stop reading with an identity check rather than catching an exception.
 
         Example usage:
 
@@ -457,8 +459,8 @@ class ZTeraDBClientProtocol(ZTeraDBTCPProtocol):
                 raise ZTeraDBQueryError(response_data['data'])
 
             # Check if the response code indicates that the query is complete
-            if response_data["response_code"] == zteradb_request_types.ResponseType.QUERY_COMPLETE.value:
-                raise QueryComplete("query_completed")
+            if response_data["response_code"] == RESPONSE_QUERY_COMPLETE:
+                return QUERY_DONE
 
             # If the response contains data, return it
             if response_data["data"]:
@@ -515,7 +517,7 @@ class ZTeraDBClientProtocol(ZTeraDBTCPProtocol):
         #   - The server authentication token for security.
         request_data = {
             "query": query.generate(),  # Generate the query string to be sent to the ZTeraDB server.
-            "request_type": zteradb_request_types.RequestType.QUERY.value,  # Set the request type as QUERY.
+            "request_type": REQUEST_QUERY,  # Set the request type as QUERY.
             "database_id": self.zteradb_conf.database_id,   # Set the database ID
             "env": self.zteradb_conf.env,   # Set the query environment
         }
@@ -523,31 +525,45 @@ class ZTeraDBClientProtocol(ZTeraDBTCPProtocol):
         # Send the query request to the ZTeraDB server.
         await self.send(json.dumps(request_data))
 
+        # Set when the query is interrupted before the whole result was read, in which case
+        # the connection is closed rather than released with the rest of the result pending.
+        interrupted = False
+
         # Attempt to parse the initial response data.
         try:
             while True:
                 # Wait for the server's response.
                 response_data = await asyncio.wait_for(self.read(), timeout=query_timeout) if query_timeout else await self.read()
 
-                # Yield parsed response data.
-                yield self.parse_query_response_data(response_data=response_data)
+                # Stop once the server reports the query as complete, otherwise yield the parsed data.
+                result = self.parse_query_response_data(response_data=response_data)
+                if result is QUERY_DONE:
+                    break
+
+                yield result
 
-        # Ignore NoResponseDataError, QueryComplete exceptions.
-        except (NoResponseDataError, QueryComplete):
+        # Ignore NoResponseDataError exceptions.
+        except NoResponseDataError:
             pass
 
         except GeneratorExit:
-            cancel_request = {
-                "query": "cancel",
-                "request_type": zteradb_request_types.RequestType.CANCEL.value
-            }
-
-            await self.send(json.dumps(cancel_request))
+            interrupted = True
+            await self.send(_CANCEL_REQUEST)
             await self.discard_all_incoming_data()
 
+        except asyncio.CancelledError:
+            # The task running the query was cancelled, e.g. by run_many() when another query failed.
+            interrupted = True
+            raise
+
         except Exception as e:
             log.error(e, exc_info=True)
 
         finally:
-            # Release the connection to connection manager
-            await connection_manager.release_connection(self)
+            if interrupted:
+                # Close the connection, the server may still be sending the result
+                await connection_manager.discard_connection(self)
+
+            else:
+                # Release the connection to connection manager
+                await connection_manager.release_connection(self)
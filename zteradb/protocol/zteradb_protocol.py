@@ -4,6 +4,8 @@
 #              TCP communication for the ZTeraDB protocol. It manages reading
 #              and writing data asynchronously over a TCP connection, as well as
 #              handling authentication, connection state, and closing of the connection.
+#              Incoming bytes are received straight into a reusable buffer and split
+#              into length-prefixed frames without going through an asyncio StreamReader.
 #
 # License: ZTeraDB
 # Copyright (c) 2025 ZTeraDB
@@ -25,50 +27,69 @@ from zteradb.lib.zteradb_data_manager import DataManager
 
 log = logging.getLogger()
 
+# Initial capacity of the receive buffer of every connection.
+_RECEIVE_BUFFER_SIZE = 256 * 1024
 
-class ZTeraDBTCPProtocol(asyncio.Protocol):
+# Minimum free space offered to the transport for a single receive.
+_MIN_RECEIVE_SIZE = 64 * 1024
+
+# Reading from the transport is paused while more frames than this wait in the queue,
+# and resumed once `read()` has drained the queue down to `_RESUME_READING_FRAMES`.
+_MAX_PENDING_FRAMES = 64
+_RESUME_READING_FRAMES = _MAX_PENDING_FRAMES // 2
+
+
+class ZTeraDBTCPProtocol(asyncio.BufferedProtocol):
     """
     A class that implements the ZTeraDB TCP protocol using asyncio. This class manages
     asynchronous TCP communication, including reading and writing data, handling
     authentication, and closing connections.
 
+    The transport receives directly into `_rxbuf`. Every complete frame found in the
+    buffer is queued as a DataManager object and consumed by `read()`.
+
     Attributes:
-        _reader: The reader stream for the connection.
-        _writer: The writer stream for the connection.
+        _transport: The transport of the connection.
         _is_authenticated: A flag indicating whether the connection is authenticated.
         _is_connected: A flag indicating whether the connection is active.
         _auth_data: Data used for authentication.
+        _rxbuf: The receive buffer the transport writes into.
+        _rxstart: The offset of the first byte not yet parsed into a frame.
+        _rxlen: The offset right after the last received byte.
+        _frames: A queue of received frames waiting to be read.
+        _discarding: A flag indicating whether incoming frames are dropped.
+        _reading_paused: A flag indicating whether reading from the transport is paused.
+        _drain_waiter: A future resolved when the transport resumes writing.
+        _connection_lost: A future resolved when the connection is lost.
     """
 
-    __slots__ = ("_reader", "_writer", "_is_authenticated", "_is_connected", "_auth_data")
+    __slots__ = ("_transport", "_is_authenticated", "_is_connected", "_auth_data", "_rxbuf", "_rxstart",
+                 "_rxlen", "_frames", "_discarding", "_reading_paused", "_drain_waiter", "_connection_lost")
 
-    def __init__(self, reader=None, writer=None):
+    def __init__(self):
         """
-        Initializes the ZTeraDBTCPProtocol instance with the provided reader and writer.
-
-        :param reader: The reader stream for the connection.
-        :param writer: The writer stream for the connection.
+        Initializes the ZTeraDBTCPProtocol instance with an empty receive buffer.
         """
-        self._reader = reader
-        self._writer = writer
+        self._transport = None
         self._is_connected = False
         self._is_authenticated = False
         self._auth_data = None
+        self._rxbuf = bytearray(_RECEIVE_BUFFER_SIZE)
+        self._rxstart = 0
+        self._rxlen = 0
+        self._frames = asyncio.Queue()
+        self._discarding = False
+        self._reading_paused = False
+        self._drain_waiter = None
+        self._connection_lost = None
         super().__init__()
 
     @property
-    def reader(self):
-        """
-        Returns the reader stream for the connection.
-        """
-        return self._reader
-
-    @property
-    def writer(self):
+    def transport(self):
         """
-        Returns the writer stream for the connection.
+        Returns the transport for the connection.
         """
-        return self._writer
+        return self._transport
 
     @property
     def is_connected(self):
@@ -107,74 +128,178 @@ class ZTeraDBTCPProtocol(asyncio.Protocol):
         """
         self._is_authenticated = is_authenticated
 
-    async def read(self):
+    def connection_made(self, transport):
         """
-        Reads data from the server.
+        Called by the event loop once the connection is established.
 
-        This method fetches the header size first, then reads the data based on the header's
-        length and returns the decoded data in the form of a DataManager object.
+        :param transport: The transport of the new connection.
+        """
+        self._transport = transport
+        self._is_connected = True
+        self._connection_lost = asyncio.get_running_loop().create_future()
 
-        :return: A DataManager object containing the decoded data or None if an error occurs.
+    def connection_lost(self, exc):
         """
-        if not self._is_connected:
-            await self.close()
-            return None
+        Called by the event loop when the connection is lost or closed.
 
-        try:
-            # Read the header (first part of the data)
-            data_header = await self.receive_all_data(data_size=DataManager.BUFFER_SIZE)
-            if not data_header:
-                return
+        Wakes up pending readers and writers so that they do not wait forever.
 
-            # Unpack the header to determine the size of the data
-            data_len = DataManager.unpack(data_header)[0]
+        :param exc: The exception that caused the connection loss, or None on a regular close.
+        """
+        self._is_connected = False
 
-            # Read the actual data based on the size in the header
-            data = await self.receive_all_data(data_size=data_len)
-            return DataManager(bytes(data))
+        if exc is not None:
+            log.debug(f"Connection lost: {exc}")
 
-        except Exception as e:
-            log.error("An error occurred while reading data. Error:", exc_info=True)
-            await self.close()
-            return None
+        # Wake up a reader waiting for a frame which will never arrive
+        self._frames.put_nowait(None)
+
+        if self._drain_waiter is not None and not self._drain_waiter.done():
+            self._drain_waiter.set_result(None)
+
+        if self._connection_lost is not None and not self._connection_lost.done():
+            self._connection_lost.set_result(None)
+
+    def pause_writing(self):
+        """
+        Called by the transport when its write buffer goes over the high watermark.
+        """
+        if self._drain_waiter is None or self._drain_waiter.done():
+            self._drain_waiter = asyncio.get_running_loop().create_future()
+
+    def resume_writing(self):
+        """
+        Called by the transport when its write buffer drains below the low watermark.
+        """
+        if self._drain_waiter is not None and not self._drain_waiter.done():
+            self._drain_waiter.set_result(None)
+
+    def get_buffer(self, sizehint):
+        """
+        Returns the free tail of the receive buffer for the transport to write into.
+
+        Pending bytes are moved to the front of the buffer only when the free space runs
+        low, and the buffer grows when a single frame does not fit into it. `buffer_updated`
+        shrinks it back once the large frame has been consumed.
+
+        :param sizehint: The minimum size the transport would like to receive at once.
+        :return: A writable memoryview over the free part of the receive buffer.
+        """
+        wanted = max(sizehint, _MIN_RECEIVE_SIZE)
+
+        if len(self._rxbuf) - self._rxlen < wanted:
+            pending = self._rxlen - self._rxstart
 
+            if self._rxstart:
+                self._rxbuf[:pending] = self._rxbuf[self._rxstart:self._rxlen]
 
-    async def receive_all_data(self, data_size):
+            self._rxstart = 0
+            self._rxlen = pending
+
+            if len(self._rxbuf) - self._rxlen < wanted:
+                self._rxbuf.extend(bytes(max(wanted, len(self._rxbuf))))
+
+        return memoryview(self._rxbuf)[self._rxlen:]
+
+    def buffer_updated(self, nbytes):
         """
-        Reads all data from the connection, ensuring that the full data of the requested size
-        is received.
+        Called by the transport after `nbytes` were written into the receive buffer.
 
-        :param data_size: The size of the data to read.
-        :return: A bytearray containing the received data.
+        Queues every complete frame found in the buffer, and pauses reading from the
+        transport when the reader falls too far behind.
+
+        :param nbytes: The number of bytes received.
         """
-        buffer = bytearray()
-        while len(buffer) < data_size:
-            try:
-                received_data = await self.reader.readexactly(data_size)
+        self._rxlen += nbytes
+
+        if self._discarding:
+            self._rxstart = self._rxlen = 0
+            return
 
-                if not received_data:
+        header_size = DataManager.BUFFER_SIZE
+
+        with memoryview(self._rxbuf) as buffer:
+            while self._rxlen - self._rxstart >= header_size:
+                data_start = self._rxstart + header_size
+                data_end = data_start + DataManager.unpack_length(buffer, self._rxstart)
+                if data_end > self._rxlen:
                     break
 
-                buffer.extend(received_data)
+                self._frames.put_nowait(DataManager(bytes(buffer[data_start:data_end])))
+                self._rxstart = data_end
+
+        if self._rxstart == self._rxlen:
+            # Everything is consumed, start over at the beginning of the buffer
+            self._rxstart = self._rxlen = 0
+
+            if len(self._rxbuf) > _RECEIVE_BUFFER_SIZE:
+                # Release the memory grown for a large frame
+                self._rxbuf = bytearray(_RECEIVE_BUFFER_SIZE)
+
+        if not self._reading_paused and self._frames.qsize() > _MAX_PENDING_FRAMES:
+            # Let the socket buffer fill up until the reader catches up
+            self._reading_paused = True
+            self._transport.pause_reading()
 
-            except (asyncio.IncompleteReadError, Exception) as e:
-                log.error(e, exc_info=True)
-                break
+    def _resume_reading(self):
+        """
+        Resumes reading from the transport if it was paused by `buffer_updated`.
+        """
+        if self._reading_paused:
+            self._reading_paused = False
+            if self._transport is not None and not self._transport.is_closing():
+                self._transport.resume_reading()
+
+    def eof_received(self):
+        """
+        Called when the server closes its side of the connection. Returning a false value
+        lets the transport close itself.
+        """
+        return False
+
+    async def read(self):
+        """
+        Reads data from the server.
 
-        return buffer
+        This method waits for the next complete frame received from the server and
+        returns it in the form of a DataManager object.
+
+        :return: A DataManager object containing the decoded data or None if the connection is closed.
+        """
+        if not self._is_connected and self._frames.empty():
+            await self.close()
+            return None
+
+        try:
+            frame = await self._frames.get()
+
+            if self._reading_paused and self._frames.qsize() <= _RESUME_READING_FRAMES:
+                self._resume_reading()
+
+            return frame
+
+        except Exception as e:
+            log.error("An error occurred while reading data. Error:", exc_info=True)
+            await self.close()
+            return None
 
     async def send(self, data: any):
         """
         Sends data to the server.
 
-        This method packs the data into a DataManager object and sends it over the writer stream.
+        This method packs the data into a DataManager object and sends it over the transport.
 
         :param data: The data to send, which will be encoded and packed.
         :return: None
         """
         try:
-            self.writer.write(DataManager(data.encode()).pack())
-            await self.writer.drain()
+            if self._transport is None or self._transport.is_closing():
+                raise ConnectionResetError("Connection lost")
+
+            self._transport.write(DataManager(data.encode()).pack())
+
+            if self._drain_waiter is not None and not self._drain_waiter.done():
+                await self._drain_waiter
 
         except (ConnectionResetError, Exception) as e:
             log.error("An error occurred while sending data", exc_info=True)
@@ -184,7 +309,7 @@ class ZTeraDBTCPProtocol(asyncio.Protocol):
         """
         Closes the client connection.
 
-        This method ensures that the connection is properly closed by stopping the writer
+        This method ensures that the connection is properly closed by closing the transport
         and cleaning up the connection state.
 
         :return: None
@@ -192,22 +317,31 @@ class ZTeraDBTCPProtocol(asyncio.Protocol):
         try:
             if self._is_connected:
                 self._is_connected = False
-                if self.writer:
-                    self.writer.close()
-                    await self.writer.wait_closed()
+                if self._transport:
+                    self._transport.close()
+                    if self._connection_lost is not None:
+                        await self._connection_lost
 
         except (ConnectionResetError, BrokenPipeError) as e:
             # Log it as a debug/info message rather than letting a raw
             # traceback escape, since the socket is successfully closed anyway.
-            log.debug(f"Socket was reset by peer during wait_closed(): {e}")
+            log.debug(f"Socket was reset by peer during close: {e}")
 
         finally:
             self._is_connected = False
 
     async def discard_all_incoming_data(self):
         try:
-            # -1 tells asyncio to read until EOF (until the sender stops sending)
-            await self.reader.read(-1)
+            # Drop everything until the server closes the connection
+            self._discarding = True
+            while not self._frames.empty():
+                self._frames.get_nowait()
+
+            # Keep receiving, so the server can finish sending and close the connection
+            self._resume_reading()
+
+            if self._connection_lost is not None:
+                await self._connection_lost
 
         except Exception as e:
             log.error(f"Error while draining: {e}", exc_info=True)
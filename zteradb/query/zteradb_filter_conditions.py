@@ -214,7 +214,9 @@ class ZTeraDBFilterCondition(ZTeraDBCommonCondition):
         if not isinstance(values, list):
             raise ValueError("'IN' filter values must be list")
 
-        operand = [value.get_fields() if isinstance(value, type(self)) else value for value in values]
+        # Resolve the condition type once, IN lists can hold thousands of plain values
+        condition_type = type(self)
+        operand = [value.get_fields() if isinstance(value, condition_type) else value for value in values]
         self.filters.append(dict(operator=ZTeraDBFilterTypes.IN.value, operand=field, result=operand))
         return self
 
@@ -19,16 +19,97 @@
 # License URL: https://zteradb.com/licence
 # -----------------------------------------------------------------------------
 
-from dataclasses import dataclass
+import sys
+import functools
+from collections import namedtuple
+from typing import NamedTuple
 from zteradb.query.zteradb_filter_conditions import ZTeraDBFilterCondition
 from zteradb.query.zteradb_query_type import ZTeraDBQueryType
 from zteradb.exceptions.zteradb_exception import ZTeraDBQueryError
 
+# Query type members bound at import time, so the builder methods assign them by reference.
+_QT_NONE = ZTeraDBQueryType.NONE
+_QT_INSERT = ZTeraDBQueryType.INSERT
+_QT_SELECT = ZTeraDBQueryType.SELECT
+_QT_UPDATE = ZTeraDBQueryType.UPDATE
+_QT_DELETE = ZTeraDBQueryType.DELETE
+
+# Keys of the generated query dictionary (see Query), interned so every query shares them.
+_K_DB, _K_SH, _K_QT, _K_FL, _K_FI, _K_FC, _K_RF, _K_ST, _K_LT, _K_CNT = map(
+    sys.intern, ("db", "sh", "qt", "fl", "fi", "fc", "rf", "st", "lt", "cnt")
+)
+
+# Value types accepted by fields() and filter().
+_SCALAR_TYPES = (str, int, float, bool, complex, bytes)
+
+# Error message raised by generate() for a query without a query type.
+_QUERY_TYPE_NOT_SET = "You forgot to call either of select(), insert(), update() or delete() method."
+
+# Sort order for each accepted sort() value, sort() rejects anything else and Sort sorts it descending.
+_SORT_NORMALIZE = {1: 1, -1: -1, "asc": 1, "ASC": 1, "desc": -1, "DESC": -1}
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_schema(schema_name):
+    """
+    Validate a schema name and return its interned form.
+
+    Queries are built again and again for the same few schemas, the cache skips the
+    validation for names that were already accepted. Invalid names raise every time.
+
+    :param schema_name: The schema name (string).
+    :return: The interned schema name.
+    :raises ValueError: If the schema name is blank.
+    """
+    if not schema_name.strip():
+        raise ValueError("Schema name is required")
+
+    return sys.intern(str(schema_name))
+
+
+def _normalize_sort_orders(orders, sort_orders):
+    """
+    Validate {field: order} pairs and store their normalized order in `sort_orders`.
+
+    :param orders: The field names and sort orders given to `ZTeraDBQuery.sort()`.
+    :param sort_orders: The dictionary receiving the normalized sort orders.
+    :raises ValueError: If a field name is not a string or an order is not ascending or descending.
+    """
+    for field, order in orders.items():
+        if type(field) is not str:
+            raise ValueError(f"'{field}' must be a schema field")
+
+        try:
+            sort_orders[field] = _SORT_NORMALIZE[order]
+        except (KeyError, TypeError):
+            raise ValueError(f"Sort order '{order}' of '{field}' must be 1 (ascending) or -1 (descending)") from None
+
+
+def _limit_error(start, end):
+    """
+    Return the error message for an invalid (start, end) limit.
+
+    :param start: The starting index given to `ZTeraDBQuery.limit()`.
+    :param end: The ending index given to `ZTeraDBQuery.limit()`.
+    :return: The message describing the first failing check.
+    """
+    if type(start) is not int:
+        return f"Limit '{start}' must be an integer"
+
+    if start < 0:
+        return f"Limit '{start}' must not be negative"
+
+    if type(end) is not int:
+        return f"Limit '{end}' must be an integer"
+
+    return f"Limit '{end}' must be greater than {start}"
+
+
 # -----------------------------------------------------------------------------
 # Class Definitions:
 #
 # 1. Query:
-#    A dataclass representing the structure of a query, including details such
+#    A named tuple representing the structure of a query, including details such
 #    as schema, database, query type, filters, sort order, etc.
 #
 # 2. Limit:
@@ -48,11 +129,13 @@ from zteradb.exceptions.zteradb_exception import ZTeraDBQueryError
 #
 # -----------------------------------------------------------------------------
 
-@dataclass
-class Query:
+class Query(NamedTuple):
     """
-    A dataclass that represents the structure of a query. It contains attributes
+    A named tuple that represents the structure of a query. It contains attributes
     for schema, database, query type, filters, sorting, related fields, etc.
+
+    Instances are immutable, use `_replace()` to derive a modified query and
+    `_asdict()` to get it as a dictionary.
     """
 
     sh: str         # Schema name
@@ -67,40 +150,20 @@ class Query:
     cnt: bool       # Flag indicating whether to count results
 
 
-class Limit:
+class Limit(namedtuple("Limit", ("start", "end"))):
     """
     Represents a limit on query results, including the start and end points for pagination.
-    """
-
-    __slots__ = ["_start", "_end"]
-
-    def __init__(self, start, end):
-        """
-        Initialize the Limit with start and end values.
 
-        :param start: The starting index for the query results.
-        :param end: The ending index for the query results.
-        """
-        # Start of the result set
-        self._start = start
-
-        # End of the result set
-        self._end = end
-
-    @property
-    def start(self):
-        """Return the start point of the limit."""
-        return self._start
+    ZTeraDBQuery stores its limit as a plain (start, end) tuple, this named tuple is kept
+    for code that builds or unpacks limits by name.
+    """
 
-    @property
-    def end(self):
-        """Return the end point of the limit."""
-        return self._end
+    __slots__ = ()
 
     @property
     def limit(self):
         """Return the limit as a tuple (start, end)."""
-        return self.start, self.end
+        return tuple(self)
 
 
 class Sort:
@@ -108,7 +171,7 @@ class Sort:
     Represents sorting order for query results. Supports ascending and descending order.
     """
 
-    __slots__ = ["_field", "_sort_order"]
+    __slots__ = ("_field", "_sort_order", "_dict")
     ASC = 1         # Ascending order
     DESC = -1       # Descending order
 
@@ -117,15 +180,22 @@ class Sort:
         Initialize the Sort with a field and order.
 
         :param field: The field to sort by.
-        :param order: The order to sort (1 for ASC, -1 for DESC).
+        :param order: The order to sort (1 or "asc" for ASC, -1 or "desc" for DESC).
         """
         self._field = field
-        self._sort_order = self.ASC if order == self.ASC else self.DESC
 
-    @property
-    def __dict__(self):
+        # Anything other than ascending sorts descending, unhashable orders included
+        try:
+            self._sort_order = _SORT_NORMALIZE.get(order, -1)
+        except TypeError:
+            self._sort_order = -1
+
+        # The dictionary form never changes, build it once
+        self._dict = {field: self._sort_order}
+
+    def to_dict(self):
         """Return the field and sort order as a dictionary."""
-        return {self.field: self._sort_order}
+        return self._dict
 
     @property
     def field(self):
@@ -150,7 +220,8 @@ class QueryFields:
     """
     A container for the field names used in the ZTeraDBQuery class.
     """
-    fields = (
+    # Slots holding the query itself.
+    query_fields = (
         "_schema_name",
         "_database_id",
         "_query_type",
@@ -164,6 +235,17 @@ class QueryFields:
         "_env",
     )
 
+    # Slots memoizing values derived from the query.
+    memo_fields = (
+        "_generated_cache",
+        "_str",
+    )
+
+    fields = query_fields + memo_fields
+
+    # Set of the field names for constant time membership checks.
+    _FIELD_SET = frozenset(fields)
+
 
 class ZTeraDBQuery:
     """
@@ -187,6 +269,8 @@ class ZTeraDBQuery:
     print(json.dumps(query.generate(), indent=2))
     """
 
+    # The slot layout is fixed here, subclasses should declare `__slots__ = ()` to
+    # reuse it instead of getting a per-instance __dict__.
     __slots__ = QueryFields.fields
 
     def __init__(self, schema_name, database_id=None):
@@ -196,32 +280,33 @@ class ZTeraDBQuery:
         :param schema_name: The name of the schema (string).
         :param database_id: The database ID (optional).
         """
-        if schema_name is None or not isinstance(schema_name, str) or schema_name.strip() == "":
+        # Checked before the cached validation, which only takes (hashable) strings
+        if not isinstance(schema_name, str):
             raise ValueError("Schema name is required")
 
-        self._schema_name = schema_name
+        # Schema names and database ids repeat across queries, intern them so they hash once
+        self._schema_name = _validate_schema(schema_name)
+        self.set_database_id(database_id)
 
-        if database_id:
-            self._database_id = database_id
+        self._query_type = _QT_NONE
 
-        self._query_type = ZTeraDBQueryType(ZTeraDBQueryType.NONE)
-        self._fields: dict = dict()
-        self._filters: dict = dict()
-        self._filter_conditions: list = []
+        # Containers are allocated on first use, most queries only need a few of them.
+        self._fields = None
+        self._filters = None
+        self._filter_conditions = None
         self._limit = None
-        self._sort: list = []
-        self._related_fields:dict = dict()
+        self._sort = None
+        self._related_fields = None
         self._count = False
 
+        # Output of the last generate() call, reset by every method that changes the query.
+        self._generated_cache = None
+
     def __str__(self):
         """Return a string representation of the query (schema and database)."""
-        if self.database_id:
-            return f"{self.database_id}.{self.schema_name}"
-
-        else:
-            return self.schema_name
+        return self._str
 
-    def __dict__(self):
+    def to_dict(self):
         """Return the query fields as a dictionary."""
         return self.fields()
 
@@ -249,49 +334,42 @@ class ZTeraDBQuery:
         query.some_dynamic_field = "some_value"  # Adds 'some_dynamic_field' to the _fields dictionary.
         print(query.some_dynamic_field)  # Output: some_value
         """
-        if attribute not in QueryFields.fields:
-            if not self._fields:
-                self._fields = dict()
-            self._fields[attribute] = value
+        if attribute in QueryFields._FIELD_SET:
+            object.__setattr__(self, attribute, value)
+            return
 
-        else:
-            super().__setattr__(attribute, value)
+        if not self._fields:
+            self._fields = dict()
+        self._fields[attribute] = value
+        self._generated_cache = None
 
     def __getattr__(self, attribute):
         """
         Custom getter method for attributes in the ZTeraDBQuery class.
 
-        This method is used to customize the behavior when accessing an attribute
-        on an instance of the `ZTeraDBQuery` class. If the attribute is not part of
-        the predefined `QueryFields.fields`, the method will look for it in the
-        `_fields` dictionary. If the attribute is found there, it will return its
-        value. If the attribute is not found, the method will return `None`.
-        If the attribute is part of the predefined `QueryFields.fields`,
-        it will be accessed using the default behavior provided by the `super()` class.
-
-        This allows for flexible handling of dynamic attributes not explicitly
-        defined in the `QueryFields.fields`.
+        Python only calls this method when the normal attribute lookup fails. If the
+        attribute is part of the predefined `QueryFields.fields` the slot is simply not
+        set and an `AttributeError` is raised. Otherwise the attribute is looked up in
+        the `_fields` dictionary, so fields set as dynamic attributes can be read back.
+        Unknown attributes raise an `AttributeError` like on any other object, use
+        `get_field()` to read a field that may not be set.
 
         :param attribute: The name of the attribute being accessed.
-        :return: The value of the attribute if found, or `None` if not found.
+        :return: The value of the field stored in `_fields`.
+        :raises AttributeError: If the attribute is neither set nor a field of the query.
 
         Example:
         query = ZTeraDBQuery("example_schema")
         query.some_dynamic_field = "some_value"
         print(query.some_dynamic_field)  # Output: some_value
-        print(query.undefined_field)  # Output: None (if undefined_field is not set)
+        print(query.get_field("undefined_field"))  # Output: None
         """
-        if attribute not in QueryFields.fields:
-            if not self._fields:
-                return None
-
-            if attribute not in self._fields:
-                return None
+        if attribute not in QueryFields._FIELD_SET:
+            fields = self._fields
+            if fields and attribute in fields:
+                return fields[attribute]
 
-            return self._fields[attribute]
-
-        else:
-            return super().__getattribute__(attribute)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attribute}'")
 
     def __delattr__(self, attribute):
         """
@@ -319,14 +397,15 @@ class ZTeraDBQuery:
         query.some_dynamic_field = "some_value"
         del query.some_dynamic_field  # This deletes 'some_dynamic_field' from _fields
         """
-        if attribute not in QueryFields.fields:
-            if not self._fields:
-                self._fields = dict()
+        if attribute in QueryFields._FIELD_SET:
+            object.__delattr__(self, attribute)
+            return
 
-            del self._fields[attribute]
+        if not self._fields:
+            self._fields = dict()
 
-        else:
-            super().__delattr__(attribute)
+        del self._fields[attribute]
+        self._generated_cache = None
 
     @property
     def schema_name(self):
@@ -365,8 +444,15 @@ class ZTeraDBQuery:
         return self._database_id
 
     def set_database_id(self, database_id):
+        if type(database_id) is str:
+            database_id = sys.intern(database_id)
+
         self._database_id = database_id
 
+        # The string representation only changes with the database id, build it here
+        self._str = f"{database_id}.{self._schema_name}" if database_id else self._schema_name
+        self._generated_cache = None
+
     def set_env(self, env):
         self._env = env
 
@@ -409,7 +495,7 @@ class ZTeraDBQuery:
         query.update()  # Sets the query type to UPDATE
         print(query.is_select_query)  # Outputs: False
         """
-        return self.query_type == ZTeraDBQueryType.SELECT
+        return self._query_type is _QT_SELECT
 
     @property
     def related_fields(self):
@@ -424,6 +510,9 @@ class ZTeraDBQuery:
         :return: The dictionary containing related field names and their associated queries.
         :rtype: dict
 
+        The query's own container is returned without a copy, do not mutate it. Use the
+        builder methods instead, they also reset the cached `generate()` output.
+
         Example:
         query = ZTeraDBQuery("example_schema")
         related_query = ZTeraDBQuery("related_schema").select()
@@ -435,7 +524,7 @@ class ZTeraDBQuery:
           populates the `_related_fields` attribute with the related field names
           and the corresponding queries.
         """
-        return self._related_fields
+        return self._related_fields or {}
 
     @property
     def filter_conditions(self):
@@ -449,6 +538,9 @@ class ZTeraDBQuery:
         :return: A list of filter conditions associated with the query.
         :rtype: list
 
+        The query's own container is returned without a copy, do not mutate it. Use the
+        builder methods instead, they also reset the cached `generate()` output.
+
         Example:
         query = ZTeraDBQuery("example_schema")
         filter_condition = ZTGT(field="age", operator=">", value=30)
@@ -459,7 +551,7 @@ class ZTeraDBQuery:
         - The filter conditions are added using the `filter_condition` method. This method
           populates the `_filter_conditions` list with the specified filter conditions.
         """
-        return self._filter_conditions
+        return self._filter_conditions or []
 
     def get_limit(self):
         """
@@ -485,10 +577,7 @@ class ZTeraDBQuery:
         query_without_limit = ZTeraDBQuery("example_schema")
         print(query_without_limit.get_limit)  # Output: []
         """
-        if isinstance(self._limit, Limit):
-            return self._limit.limit
-
-        return []
+        return self._limit if self._limit is not None else []
 
     def set_query_type(self, query_type):
         """
@@ -509,10 +598,11 @@ class ZTeraDBQuery:
         query.set_query_type(ZTeraDBQueryType.SELECT)  # Sets the query type to SELECT
         print(query.query_type)  # Output: ZTeraDBQueryType.SELECT
         """
-        if not isinstance(query_type, ZTeraDBQueryType):
+        if type(query_type) is not ZTeraDBQueryType and not isinstance(query_type, ZTeraDBQueryType):
             raise ValueError(f"'{query_type}' must be an instance of ZTeraDBQueryType ")
 
         self._query_type = query_type
+        self._generated_cache = None
 
     def insert(self):
         """
@@ -532,15 +622,15 @@ class ZTeraDBQuery:
         query.insert()  # Sets the query type to INSERT
         print(query.query_type)  # Output: ZTeraDBQueryType.INSERT
         """
-        self.set_query_type(query_type=ZTeraDBQueryType.INSERT)
+        self._query_type = _QT_INSERT
+        self._generated_cache = None
         return self
 
     def select(self):
         """
         Set the query type to SELECT for the current `ZTeraDBQuery` instance.
 
-        This method is used to set the query type of the `ZTeraDBQuery` instance to `SELECT`. It
-        utilizes the `set_query_type` method to ensure the correct query type is set. This is helpful
+        This method is used to set the query type of the `ZTeraDBQuery` instance to `SELECT`. This is helpful
         when constructing a `SELECT` query using the `ZTeraDBQuery` class.
 
         :return: The current `ZTeraDBQuery` instance, allowing for method chaining.
@@ -551,15 +641,15 @@ class ZTeraDBQuery:
         query.select()  # Sets the query type to SELECT
         print(query.query_type)  # Output: ZTeraDBQueryType.SELECT
         """
-        self.set_query_type(query_type=ZTeraDBQueryType.SELECT)
+        self._query_type = _QT_SELECT
+        self._generated_cache = None
         return self
 
     def update(self):
         """
         Set the query type to UPDATE for the current `ZTeraDBQuery` instance.
 
-        This method is used to set the query type of the `ZTeraDBQuery` instance to `UPDATE`. It
-        utilizes the `set_query_type` method to ensure the correct query type is set. This is helpful
+        This method is used to set the query type of the `ZTeraDBQuery` instance to `UPDATE`. This is helpful
         when constructing an `UPDATE` query using the `ZTeraDBQuery` class.
 
         :return: The current `ZTeraDBQuery` instance, allowing for method chaining.
@@ -570,15 +660,15 @@ class ZTeraDBQuery:
         query.update()  # Sets the query type to UPDATE
         print(query.query_type)  # Output: ZTeraDBQueryType.UPDATE
         """
-        self.set_query_type(query_type=ZTeraDBQueryType.UPDATE)
+        self._query_type = _QT_UPDATE
+        self._generated_cache = None
         return self
 
     def delete(self):
         """
         Set the query type to DELETE for the current `ZTeraDBQuery` instance.
 
-        This method is used to set the query type of the `ZTeraDBQuery` instance to `DELETE`. It
-        utilizes the `set_query_type` method to ensure the correct query type is set. This is helpful
+        This method is used to set the query type of the `ZTeraDBQuery` instance to `DELETE`. This is helpful
         when constructing a `DELETE` query using the `ZTeraDBQuery` class.
 
         :return: The current `ZTeraDBQuery` instance, allowing for method chaining.
@@ -589,7 +679,8 @@ class ZTeraDBQuery:
         query.delete()  # Sets the query type to DELETE
         print(query.query_type)  # Output: ZTeraDBQueryType.DELETE
         """
-        self.set_query_type(query_type=ZTeraDBQueryType.DELETE)
+        self._query_type = _QT_DELETE
+        self._generated_cache = None
         return self
 
     def fields(self, **kwargs):
@@ -608,6 +699,7 @@ class ZTeraDBQuery:
 
         return:
             ZTeraDBQuery: The current instance of the ZTeraDBQuery with the updated fields.
+            Without arguments, the query's own fields dictionary, do not mutate it.
 
         raises:
             ValueError: If the field name is not a string or the value is an object.
@@ -620,17 +712,74 @@ class ZTeraDBQuery:
             fields = query.fields()  # Returns the dictionary: {"name": "John", "age": 30}
         """
         if kwargs:
+            # Validate everything first, then store all the fields in a single update
             for field, value in kwargs.items():
-                if not isinstance(field, str) and field.strip():
-                    raise ValueError(f"'{field}' must be  a schema field")
+                if type(field) is not str or not field.strip():
+                    raise ValueError(f"'{field}' must be a schema field")
 
-                if not isinstance(value, (str, int, float, bool, complex, bytes)) and isinstance(value, object):
+                if not isinstance(value, _SCALAR_TYPES):
                     raise ValueError(f"'{value}' must not be any object.")
 
-                self._fields[field] = value
+            if self._fields is None:
+                self._fields = dict()
+
+            self._fields.update(kwargs)
+            self._generated_cache = None
             return self
 
-        return self._fields
+        return self._fields or {}
+
+    def field(self, name, value):
+        """
+        Sets a single field of the query.
+
+        This is the explicit counterpart of assigning a dynamic attribute
+        (`query.name = value`). It writes straight into the `_fields` dictionary and
+        skips the attribute dispatch of `__setattr__`, which makes it the preferred way
+        to set fields from builder loops.
+
+        :param name: The field name (string).
+        :param value: The value of the field.
+        :return: The current ZTeraDBQuery instance, allowing for method chaining.
+        :raises ValueError: If the field name is not a string or the value is an object, as in `fields()`.
+
+        Example:
+        query = ZTeraDBQuery("example_schema").insert()
+        for name, value in row.items():
+            query.field(name, value)
+        """
+        if type(name) is not str or not name.strip():
+            raise ValueError(f"'{name}' must be a schema field")
+
+        if not isinstance(value, _SCALAR_TYPES):
+            raise ValueError(f"'{value}' must not be any object.")
+
+        if self._fields is None:
+            self._fields = dict()
+
+        self._fields[name] = value
+        self._generated_cache = None
+        return self
+
+    def get_field(self, name):
+        """
+        Returns the value of a single field of the query.
+
+        This is the explicit counterpart of reading a dynamic attribute (`query.name`), it
+        returns `None` instead of raising an `AttributeError` when the field is not set.
+
+        :param name: The field name (string).
+        :return: The value of the field, or `None` if the field is not set.
+
+        Example:
+        query = ZTeraDBQuery("example_schema").field("name", "John")
+        print(query.get_field("name"))  # Output: John
+        print(query.get_field("age"))  # Output: None
+        """
+        if not self._fields:
+            return None
+
+        return self._fields.get(name)
 
     def related_field(self, **kwargs):
         """
@@ -660,16 +809,27 @@ class ZTeraDBQuery:
         # In the above example, the related fields 'related_field_1' and 'related_field_2'
         # are added to the query, each associated with a respective ZTeraDBQuery instance.
         """
-        # Loop over each provided related_field argument
+        if not kwargs:
+            return self
+
+        # Validate every provided related_field argument before touching the query
         for related_field_name, related_field_query in kwargs.items():
-            if not isinstance(related_field_name, str):
+            if type(related_field_name) is not str:
                 raise ValueError(f"'{related_field_name}' must be related field name ")
 
-            if not isinstance(related_field_query, ZTeraDBQuery):
+            if type(related_field_query) is not ZTeraDBQuery and not isinstance(related_field_query, ZTeraDBQuery):
                 raise ValueError(f"'{related_field_query}' must be an instance of ZTeraDBQuery")
 
-            # Add the related field to the _related_fields dictionary with its generated query
-            self._related_fields[related_field_name] = related_field_query.generate()
+        if self._related_fields is None:
+            self._related_fields = dict()
+
+        # Add the related fields with their generated queries, a sub-query used
+        # more than once is served from its generate() cache
+        self._related_fields.update(
+            {related_field_name: related_field_query.generate()
+             for related_field_name, related_field_query in kwargs.items()}
+        )
+        self._generated_cache = None
 
         # Return the current instance to allow for method chaining
         return self
@@ -704,15 +864,22 @@ class ZTeraDBQuery:
           conditions for the query. The filters are applied during query generation to
           restrict the results based on the provided criteria.
         """
+        if not kwargs:
+            return self
+
+        # Validate everything first, then store all the filters in a single update
         for field, value in kwargs.items():
-            if not isinstance(field, str):
+            if type(field) is not str or not field:
                 raise ValueError(f"'{field}' must be a schema field")
 
-            if value and not isinstance(value, (str, int, float, bool, complex, bytes)) and isinstance(value, object):
+            if value is not None and not isinstance(value, _SCALAR_TYPES):
                 raise ValueError(f"'{value}' must not be any object.")
 
-            self._filters[field] = value
+        if self._filters is None:
+            self._filters = dict()
 
+        self._filters.update(kwargs)
+        self._generated_cache = None
         return self
 
     def filters(self):
@@ -726,6 +893,9 @@ class ZTeraDBQuery:
         :return: A dictionary containing all the field-value pairs used as filters.
         :rtype: dict
 
+        The query's own container is returned without a copy, do not mutate it. Use the
+        builder methods instead, they also reset the cached `generate()` output.
+
         Example:
         query = ZTeraDBQuery("example_schema")
         query.filter(age=30, city="New York")
@@ -736,7 +906,7 @@ class ZTeraDBQuery:
           through the `filter` method or any other filtering mechanism. It helps in
           inspecting the current filter criteria.
         """
-        return self._filters
+        return self._filters or {}
 
     def filter_condition(self, filter_condition):
         """
@@ -765,25 +935,75 @@ class ZTeraDBQuery:
         - The `filter_condition` method allows for flexible and dynamic filter conditions
           to be added to the query using instances of `ZTeraDBFilterCondition`.
         """
-        if not isinstance(filter_condition, ZTeraDBFilterCondition):
+        if type(filter_condition) is not ZTeraDBFilterCondition and not isinstance(filter_condition, ZTeraDBFilterCondition):
             raise ValueError("'filter_condition' must be an instance of ZTeraDBFilterCondition")
 
-        self._filter_conditions.append(filter_condition.get_fields())
+        # A condition without any filter adds nothing to the query, skip it here
+        fields = filter_condition.get_fields()
+        if not fields:
+            return self
+
+        if self._filter_conditions is None:
+            self._filter_conditions = []
+
+        self._filter_conditions.append(fields)
+        self._generated_cache = None
+        return self
+
+    def filter_conditions_add(self, *filter_conditions):
+        """
+        Add several filter conditions to the query at once.
+
+        This is the bulk counterpart of `filter_condition()`, useful when the conditions are
+        already collected in a list. All the conditions are validated first, then their fields
+        are appended to the internal list of filter conditions in a single extend.
+
+        :param filter_conditions: Instances of `ZTeraDBFilterCondition` to be added to the query.
+        :return: The current `ZTeraDBQuery` instance, allowing method chaining.
+        :rtype: ZTeraDBQuery
+
+        :raises ValueError: If any of the conditions is not an instance of `ZTeraDBFilterCondition`.
+
+        Example:
+        query = ZTeraDBQuery("example_schema")
+        conditions = [ZTGTE(["age", 30]), ZTLT(["age", 60])]
+        query.filter_conditions_add(*conditions)
+        """
+        for filter_condition in filter_conditions:
+            if type(filter_condition) is not ZTeraDBFilterCondition and not isinstance(filter_condition, ZTeraDBFilterCondition):
+                raise ValueError("'filter_condition' must be an instance of ZTeraDBFilterCondition")
+
+        # Conditions without any filter add nothing to the query, skip them here
+        fields = [condition_fields for condition_fields in (filter_condition.get_fields() for filter_condition in filter_conditions)
+                  if condition_fields]
+        if not fields:
+            return self
+
+        if self._filter_conditions is None:
+            self._filter_conditions = []
+
+        self._filter_conditions.extend(fields)
+        self._generated_cache = None
         return self
 
-    def sort(self, **kwargs):
+    def sort(self, *sorts, **kwargs):
         """
         Add sorting to the current query based on the specified fields and their respective sort order.
         The method accepts keyword arguments (`**fields`) where the key is the field name (string) and
-        the value is the desired sort order (either 1 for ascending or -1 for descending).
+        the value is the desired sort order (either 1 for ascending or -1 for descending). `Sort`
+        instances and `{field: order}` dictionaries can also be passed positionally, they are applied
+        before the keyword arguments.
 
-        The `Sort` objects created for each field are appended to the `_sort` list. This allows for
-        multiple fields to be sorted in a specific order, which will later be used when generating the query.
+        The normalized sort order of each field is stored in the `_sort` dictionary, in the order the
+        fields were given. This allows for multiple fields to be sorted in a specific order, which will
+        later be used when generating the query.
 
+        :param sorts: `Sort` instances or dictionaries of field names and sort orders.
         :param kwargs: A dictionary where each key is the field name (string) to sort by,
                        and each value is the sort order (either 1 for ascending or -1 for descending).
         :return: The current `ZTeraDBQuery` instance, allowing for method chaining.
-        :raises ValueError: If the provided order is not 1 (ascending) or -1 (descending).
+        :raises ValueError: If the provided order is not 1 / "asc" (ascending) or -1 / "desc" (descending),
+                            or a positional argument is neither a `Sort` nor a dictionary.
 
         Example:
         query = ZTeraDBQuery("example_schema")
@@ -793,14 +1013,35 @@ class ZTeraDBQuery:
 
         # In the above example, 'name' will be sorted in ascending order,
         # and 'age' will be sorted in descending order.
+
+        # The same sort built from a Sort instance and a dictionary
+        query.sort(Sort("name", Sort.ASC), {"age": -1})
         """
-        # Loop over each field and its associated order
-        for field, order in kwargs.items():
-            # Create a Sort object for the field and order
-            sort_order = Sort(field, order)
+        if not sorts and not kwargs:
+            return self
 
-            # Append the created Sort object to the _sort list
-            self._sort.append(sort_order)
+        # Normalize and validate every order before touching the query
+        sort_orders = dict()
+        for sort in sorts:
+            if isinstance(sort, dict):
+                _normalize_sort_orders(sort, sort_orders)
+
+            elif isinstance(sort, Sort):
+                # Sort instances are normalized when they are created
+                sort_orders[sort.field] = sort.sort_order
+
+            else:
+                raise ValueError(f"'{sort}' must be an instance of Sort or a dictionary")
+
+        # Keyword arguments are the common case, they never allocate Sort objects
+        _normalize_sort_orders(kwargs, sort_orders)
+
+        # Store a new dictionary, generated queries embedded elsewhere keep the previous one
+        if self._sort:
+            self._sort = {**self._sort, **sort_orders}
+        else:
+            self._sort = sort_orders
+        self._generated_cache = None
 
         # Return the current instance to allow for method chaining
         return self
@@ -811,11 +1052,12 @@ class ZTeraDBQuery:
 
         This method returns a dictionary of fields and their respective sort order
         (either ascending or descending) for the query. The sorting is determined
-        by the fields added to the `_sort` list using the `sort()` method.
+        by the fields added to the `_sort` dictionary using the `sort()` method.
 
         Returns:
             dict: A dictionary where the keys are the field names, and the values are
                   the corresponding sort order (1 for ascending, -1 for descending).
+                  This is the query's own dictionary, do not mutate it.
 
         Example:
             If the following sort fields were set:
@@ -827,7 +1069,7 @@ class ZTeraDBQuery:
                 "age": -1
             }
         """
-        return {sort.field: sort.sort_order for sort in self._sort if isinstance(sort, Sort)}
+        return self._sort or {}
 
     def limit(self, start, end):
         """
@@ -843,21 +1085,15 @@ class ZTeraDBQuery:
             ZTeraDBQuery: The current `ZTeraDBQuery` instance, allowing for method chaining.
 
         raises:
-            ValueError: If `start` or `end` is not an integer.
+            ValueError: If `start` or `end` is not an integer, `start` is negative or `end`
+                        is not greater than `start`.
         """
-        if not isinstance(start, int):
-            raise ValueError(f"Limit '{start}' must be an integer")
-
-        elif start < 0:
-                raise ValueError(f"Limit '{start}' must not be negative")
-
-        if not isinstance(end, int):
-            raise ValueError(f"Limit '{start}' must be an integer")
-
-        if end is not None and end <= start:
-            raise ValueError(f"Limit '{end}' must be greater than {start}")
+        # One combined guard on the happy path, the failing check is worked out by _limit_error()
+        if type(start) is not int or type(end) is not int or start < 0 or end <= start:
+            raise ValueError(_limit_error(start, end))
 
-        self._limit = Limit(start, end)
+        self._limit = (start, end)
+        self._generated_cache = None
         return self
 
     def count(self):
@@ -871,6 +1107,7 @@ class ZTeraDBQuery:
             ZTeraDBQuery: The current `ZTeraDBQuery` instance, allowing for method chaining.
         """
         self._count = True
+        self._generated_cache = None
         return self
 
     @property
@@ -890,6 +1127,9 @@ class ZTeraDBQuery:
         Generates and returns the full query as a dictionary.
 
         Combines all attributes such as filters, sorting, fields, and limit into a complete query.
+        The result is cached until one of the builder methods changes the query, so calling
+        `generate()` again (for example on a sub-query passed to several `related_field()`
+        calls) returns the same dictionary. Treat it as read-only.
 
         Returns:
             dict: A dictionary representing the full query, including all attributes like
@@ -899,10 +1139,48 @@ class ZTeraDBQuery:
             Exception: If no query type has been set (i.e., if `select()`, `insert()`, `update()`,
                         or `delete()` has not been called).
         """
-        if not isinstance(self.query_type, ZTeraDBQueryType) or not self.query_type.value:
-            raise ZTeraDBQueryError("You forgot to call either of select(), insert(), update() or delete() method.")
+        if self._generated_cache is not None:
+            return self._generated_cache
 
-        query = Query(db=self.database_id, sh=self.schema_name, qt=self.query_type.value, fl=self.fields(), fi=self.filters(),
-                      fc=self.filter_conditions, rf=self.related_fields, st=self.get_sort(), lt=self.get_limit(), cnt=self._count)
+        query_type_code = _QUERY_TYPE_CODES.get(self._query_type)
+        if query_type_code is None:
+            raise ZTeraDBQueryError(_QUERY_TYPE_NOT_SET)
+
+        self._generated_cache = _generate_query(self, query_type_code)
+        return self._generated_cache
+
+
+# -----------------------------------------------------------------------------
+# Query generator:
+#
+# Every query type is generated the same way: the keys every query has plus
+# each key of the Query layout that is set, in the Query layout order.
+# ZTeraDBQuery.generate() looks up the query type code in _QUERY_TYPE_CODES.
+#
+# -----------------------------------------------------------------------------
 
-        return {key: val for key, val in query.__dict__.items() if val}
+def _generate_query(query, query_type_code):
+    """Build the query dictionary of the given ZTeraDBQuery with the given query type code."""
+    out = {_K_SH: query._schema_name}
+    if query._database_id:
+        out[_K_DB] = query._database_id
+    out[_K_QT] = query_type_code
+    if query._fields:
+        out[_K_FL] = query._fields
+    if query._related_fields:
+        out[_K_RF] = query._related_fields
+    if query._filters:
+        out[_K_FI] = query._filters
+    if query._filter_conditions:
+        out[_K_FC] = query._filter_conditions
+    if query._sort:
+        out[_K_ST] = query._sort
+    if query._limit:
+        out[_K_LT] = query._limit
+    if query._count:
+        out[_K_CNT] = query._count
+    return out
+
+
+# Wire code of each query type, ZTeraDBQueryType.NONE has none.
+_QUERY_TYPE_CODES = {query_type: int(query_type) for query_type in (_QT_INSERT, _QT_SELECT, _QT_UPDATE, _QT_DELETE)}
@@ -19,8 +19,9 @@
 # -----------------------------------------------------------------------------
 
 import enum
+import functools
 
-class ZTeraDBQueryType(enum.Enum):
+class ZTeraDBQueryType(enum.IntEnum):
     """
     Enum class to represent different types of ZTeraDB queries.
     This enum includes the following types:
@@ -55,7 +56,7 @@ class ZTeraDBQueryType(enum.Enum):
 
         :return: True if the query type is INSERT, False otherwise.
         """
-        return self.INSERT == self
+        return self is ZTeraDBQueryType.INSERT
 
     def is_select(self):
         """
@@ -63,7 +64,7 @@ class ZTeraDBQueryType(enum.Enum):
 
         :return: True if the query type is SELECT, False otherwise.
         """
-        return self.SELECT == self
+        return self is ZTeraDBQueryType.SELECT
 
     def is_update(self):
         """
@@ -71,7 +72,7 @@ class ZTeraDBQueryType(enum.Enum):
 
         :return: True if the query type is UPDATE, False otherwise.
         """
-        return self.UPDATE == self
+        return self is ZTeraDBQueryType.UPDATE
 
     def is_delete(self):
         """
@@ -79,7 +80,7 @@ class ZTeraDBQueryType(enum.Enum):
 
         :return: True if the query type is DELETE, False otherwise.
         """
-        return self.DELETE == self
+        return self is ZTeraDBQueryType.DELETE
 
     @classmethod
     def get_query_type(cls, value):
@@ -89,7 +90,7 @@ class ZTeraDBQueryType(enum.Enum):
         :param value: The value representing the query type (e.g., 0X1 for INSERT).
         :return: The corresponding ZTeraDBQueryType enum value, or None if not found.
         """
-        return cls(value) if value else None
+        return cls._fast_value_map.get(value)
 
     @classmethod
     def get_query_type_from_string(cls, query_type):
@@ -99,8 +100,19 @@ class ZTeraDBQueryType(enum.Enum):
         :param query_type: QueryType - The string representation of the query type (e.g., 'SELECT').
         :return: The corresponding ZTeraDBQueryType enum value, or None if not found.
         """
-        query_type = query_type.upper()
-        if hasattr(cls, query_type):
-            return cls(getattr(cls, query_type))
+        return _query_type_from_string(query_type)
 
-        return None
+
+# Value to member map used by get_query_type(), NONE is left out so 0 resolves to None.
+ZTeraDBQueryType._fast_value_map = {member.value: member for member in ZTeraDBQueryType if member.value}
+
+
+@functools.lru_cache(maxsize=16)
+def _query_type_from_string(query_type):
+    """
+    Look up a query type by its (case-insensitive) name, cached per spelling.
+
+    :param query_type: str - The string representation of the query type (e.g., 'select').
+    :return: The corresponding ZTeraDBQueryType enum value, or None if not found.
+    """
+    return ZTeraDBQueryType.__members__.get(query_type.upper())
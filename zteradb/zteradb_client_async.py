@@ -31,13 +31,19 @@ from zteradb.connection.zteradb_connection import ZTeraDBConnectionAsync
 # and closing connections.
 from zteradb.query.zteradb_query import ZTeraDBQuery, Sort
 
-# Import all the configuration settings and classes from zteradb_config.py.
+# Import the configuration settings and classes from the config package.
 # This provides access to the configuration needed for interacting with the TeraDB
 # service, such as API keys, connection pool options, and environment settings.
-from zteradb.config.zteradb_config import *
+from zteradb.config.zteradb_config import ZTeraDBConfig, ZTERADB_CONF
+from zteradb.config.options import Options
+from zteradb.config.connection_pool import ConnectionPool
+from zteradb.config.envs import ENVS
+from zteradb.config.response_data_types import ResponseDataTypes
 
 
-# Import all filter condition functions from the filter_condition_functions module.
-# These functions may include various utilities for filtering and processing data
-# for querying the TeraDB service.
-from zteradb.query.filter_condition import *
\ No newline at end of file
+# Import the filter condition functions from the filter_condition module.
+# These functions build the filter conditions used when querying the TeraDB service.
+from zteradb.query.filter_condition import (
+    ZTAND, ZTOR, ZTEQUAL, ZTIN, ZTADD, ZTSUB, ZTMUL, ZTDIV, ZTMOD, ZTGT, ZTGTE, ZTLT, ZTLTE,
+    ZTCONTAINS, ZTICONTAINS, ZTSTARTSWITH, ZTISTARTSWITH, ZTENDSWITH, ZTIENDSWITH, ZTeraDBFilterCondition,
+)